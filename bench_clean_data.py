@@ -0,0 +1,122 @@
+"""Micro-benchmark for clean_data() on synthetic 95-parameter data.
+
+Compares the previous string-round-trip implementation with the current one
+on raw sheets (as downloaded) and on sheets that have already been cleaned
+(as served from the cache or snapshot).
+
+    python bench_clean_data.py [--repeat N]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from fed_data import STAT_COLUMNS, clean_data, resolve_schema
+
+N_PARAMETERS = 95
+REGIONS = ['All India', 'Arunachal Pradesh', 'Gujarat', 'Jammu & Kashmir', 'Madhya Pradesh', 'Maharashtra',
+           'Meghalaya', 'Mizoram', 'Orissa', 'Punjab', 'Tamil Nadu', 'Uttar Pradesh', 'West Bengal']
+# Alternative header spellings seen in the source sheets
+LAYOUTS = [
+    ['State', '5th Percentile', 'Mean', '95th Percentile'],
+    ['Region', '5th percentile value', 'Average', '95th percentile value'],
+    ['State', '5th Percentile', 'Mean', '95th Percentile', 'SD'],
+]
+
+
+def legacy_clean_data(df):
+    """clean_data() as it was before the schema cache, kept for comparison"""
+    df_clean = df.copy()
+    numeric_columns = ['5th Percentile', 'Mean', '95th Percentile']
+    existing_numeric_cols = [col for col in numeric_columns if col in df_clean.columns]
+
+    if not existing_numeric_cols:
+        potential_cols = [col for col in df_clean.columns if any(
+            keyword in str(col).lower() for keyword in ['percentile', 'mean', 'average', '5th', '95th']
+        )]
+        if len(potential_cols) >= 3:
+            df_clean = df_clean.rename(columns={
+                potential_cols[0]: '5th Percentile',
+                potential_cols[1]: 'Mean',
+                potential_cols[2]: '95th Percentile'
+            })
+            existing_numeric_cols = ['5th Percentile', 'Mean', '95th Percentile']
+
+    for col in existing_numeric_cols:
+        if col in df_clean.columns:
+            df_clean[col] = df_clean[col].astype(str)
+            df_clean[col] = df_clean[col].str.replace(r'[^\d.-]', '', regex=True)
+            df_clean[col] = df_clean[col].replace('', np.nan)
+            df_clean[col] = df_clean[col].replace('-', np.nan)
+            df_clean[col] = pd.to_numeric(df_clean[col], errors='coerce')
+
+    if existing_numeric_cols:
+        df_clean = df_clean.dropna(subset=existing_numeric_cols, how='all')
+
+    if 'State' not in df_clean.columns:
+        potential_state_cols = [col for col in df_clean.columns if any(
+            keyword in str(col).lower() for keyword in ['state', 'region', 'location', 'area']
+        )]
+        if potential_state_cols:
+            df_clean = df_clean.rename(columns={potential_state_cols[0]: 'State'})
+
+    return df_clean
+
+
+def synthetic_sheets(n_parameters=N_PARAMETERS, seed=0):
+    """Raw sheets shaped like the Google Sheets CSV exports, with units and blanks in the text"""
+    rng = np.random.default_rng(seed)
+    sheets = []
+    for i in range(n_parameters):
+        layout = LAYOUTS[i % len(LAYOUTS)]
+        mean = rng.uniform(20, 1500, size=len(REGIONS))
+        sd = mean * rng.uniform(0.04, 0.12, size=len(REGIONS))
+        values = np.stack([mean - 1.645 * sd, mean, mean + 1.645 * sd])
+        data = {layout[0]: REGIONS}
+        for name, column in zip(layout[1:4], values):
+            text = [f"{v:.1f} mm" for v in column]
+            text[rng.integers(len(text))] = '-'
+            data[name] = text
+        if len(layout) > 4:
+            data[layout[4]] = [f"{v:.2f}" for v in sd]
+        sheets.append(pd.DataFrame(data))
+    # Footer row with no numbers, as in some exports
+    sheets[0].loc[len(sheets[0])] = ['Source: CIAE 2009', '', '', '']
+    return sheets
+
+
+def time_per_sheet(func, sheets, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for sheet in sheets:
+            func(sheet)
+        best = min(best, time.perf_counter() - start)
+    return best / len(sheets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    raw = synthetic_sheets()
+    for old, new in zip(map(legacy_clean_data, raw), map(clean_data, raw)):
+        pd.testing.assert_frame_equal(old[STAT_COLUMNS].astype('float64'), new[STAT_COLUMNS])
+    cleaned = [clean_data(sheet) for sheet in raw]
+
+    rows = [
+        ("legacy, raw sheets", time_per_sheet(legacy_clean_data, raw, args.repeat)),
+        ("current, raw sheets", time_per_sheet(clean_data, raw, args.repeat)),
+        ("legacy, re-clean cached sheets", time_per_sheet(legacy_clean_data, cleaned, args.repeat)),
+        ("current, re-clean cached sheets", time_per_sheet(clean_data, cleaned, args.repeat)),
+    ]
+    print(f"clean_data on {len(raw)} synthetic sheets x {len(REGIONS)} regions (best of {args.repeat})")
+    for label, seconds in rows:
+        print(f"  {label:<34} {seconds * 1e6:9.1f} us/sheet")
+    print(f"  schema cache: {resolve_schema.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
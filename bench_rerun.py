@@ -0,0 +1,187 @@
+"""End-to-end latency benchmark of the app's data path against a local Sheets/Drive stand-in.
+
+Starts bench_standin.StandinServer in-process, points the app at it through
+FED_SHEETS_BASE_URL / FED_DRIVE_BASE_URL with an empty FED_CACHE_DIR, and
+reports p50 / p95 timings for
+
+    fetch            one sheet CSV download
+    read_csv         parsing the downloaded bytes
+    clean_data       cleaning the parsed sheet
+    figure           building the bar, radar and male/female charts (plus their JSON)
+    rerun            full FED_CODE.py script runs: cold start, Fetch Data, tab switch, Compare load
+
+    python bench_rerun.py [--repeat N] [--latency 0.15] [--jitter 0.1] [--failure-rate 0.05]
+"""
+import argparse
+import ast
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import time
+import warnings
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "FED_CODE.py")
+FIGURE_FUNCTIONS = ("create_enhanced_bar_plot", "create_radar_chart", "create_combined_chart")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentiles(samples):
+    """(p50, p95) in milliseconds"""
+    if not samples:
+        return float("nan"), float("nan")
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0] * 1e3, ordered[0] * 1e3
+    p50 = statistics.median(ordered)
+    p95 = statistics.quantiles(ordered, n=20, method="inclusive")[-1]
+    return p50 * 1e3, p95 * 1e3
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def load_app_functions(names, path=APP_SCRIPT):
+    """Selected top-level functions of the Streamlit script, without running the script itself"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    body = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))
+            or (isinstance(node, ast.FunctionDef) and node.name in names)]
+    namespace = {"__name__": "fed_app_functions"}
+    exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), namespace)
+    return [namespace[name] for name in names]
+
+
+def bench_data_path(links, repeat):
+    """fetch / read_csv / clean_data / figure samples over every sheet, repeat times"""
+    import io
+
+    import pandas as pd
+
+    from fed_data import clean_data, sheet_csv_url
+    from fed_prefetch import make_session
+
+    bar_plot, radar_chart, combined_chart = load_app_functions(FIGURE_FUNCTIONS)
+    samples = {"fetch": [], "read_csv": [], "clean_data": [], "figure": []}
+    failures = 0
+    session = make_session()
+    try:
+        for _ in range(repeat):
+            frames = {}
+            for key, url in links.items():
+                try:
+                    response, seconds = timed(session.get, sheet_csv_url(url))
+                    response.raise_for_status()
+                except Exception:
+                    failures += 1
+                    continue
+                samples["fetch"].append(seconds)
+                raw, seconds = timed(pd.read_csv, io.BytesIO(response.content))
+                samples["read_csv"].append(seconds)
+                frames[key], seconds = timed(clean_data, raw)
+                samples["clean_data"].append(seconds)
+
+            for (parameter, gender), df in frames.items():
+                states = df['State'].tolist() if 'State' in df.columns else []
+                start = time.perf_counter()
+                figures = [bar_plot(df, list(states), parameter), radar_chart(df, states[:6], parameter)]
+                other = frames.get((parameter, "Female"))
+                if gender == "Male" and other is not None:
+                    figures.append(combined_chart(df, other, parameter))
+                for fig in figures:
+                    if fig is not None:
+                        fig.to_json()
+                samples["figure"].append(time.perf_counter() - start)
+    finally:
+        session.close()
+    return samples, failures
+
+
+def bench_reruns(repeat, parameters, timeout):
+    """Full script runs through Streamlit's AppTest, one sample per interaction"""
+    from streamlit.testing.v1 import AppTest
+
+    samples = {"rerun: cold start": [], "rerun: fetch data": [], "rerun: tab switch": [], "rerun: compare load": [],
+               "rerun: idle": []}
+    app = AppTest.from_file(APP_SCRIPT, default_timeout=timeout)
+    _, seconds = timed(app.run)
+    samples["rerun: cold start"].append(seconds)
+
+    def interact(label, action, tab=None):
+        if tab is not None:
+            app.session_state["active_tab"] = tab
+        start = time.perf_counter()
+        action().run()
+        samples[label].append(time.perf_counter() - start)
+
+    for i in range(repeat):
+        parameter = parameters[i % len(parameters)]
+        app.session_state["active_tab"] = "📋 Parameter Info"
+        app.sidebar.selectbox[0].select(parameter).run()
+        interact("rerun: fetch data", lambda: app.sidebar.button[0].click())
+        interact("rerun: tab switch", lambda: app, "👨 Male Population")
+        interact("rerun: tab switch", lambda: app, "🔄 Compare Data")
+        interact("rerun: compare load", lambda: app.button(key="comparison_button").click(), "🔄 Compare Data")
+        interact("rerun: idle", lambda: app, "🔄 Compare Data")
+    errors = [element.value for element in app.exception]
+    return samples, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0.05, help="stand-in latency per request (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.05, help="extra random stand-in latency (seconds)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of stand-in requests that fail")
+    parser.add_argument("--timeout", type=float, default=300, help="AppTest timeout per run (seconds)")
+    parser.add_argument("--skip-reruns", action="store_true", help="only benchmark the data path")
+    args = parser.parse_args()
+
+    # The fed_* modules read their configuration at import, so set it up before importing them
+    base_url = f"http://127.0.0.1:{free_port()}"
+    cache_dir = tempfile.mkdtemp(prefix="fed_bench_")
+    os.environ.update({"FED_SHEETS_BASE_URL": base_url, "FED_DRIVE_BASE_URL": base_url,
+                       "FED_CACHE_DIR": cache_dir})
+    os.environ.pop("FED_OFFLINE_BUNDLE", None)
+    warnings.filterwarnings("ignore")
+
+    from bench_standin import StandinServer
+    from fed_catalog import CATALOG
+    from fed_data import GENDERS
+
+    port = int(base_url.rsplit(":", 1)[1])
+    links = {(parameter, gender): url for gender in GENDERS for parameter, url in CATALOG.sheet_links(gender).items()}
+    with StandinServer(port=port, latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate) as server:
+        samples, failures = bench_data_path(links, args.repeat)
+        errors = []
+        if not args.skip_reruns:
+            parameters = [p.name for p in CATALOG if p.male_sheet and p.female_sheet][:max(args.repeat, 1)]
+            rerun_samples, errors = bench_reruns(args.repeat, parameters, args.timeout)
+            samples.update(rerun_samples)
+        stats = dict(server.stats)
+
+    print(f"Stand-in: latency {args.latency * 1e3:.0f} ms + up to {args.jitter * 1e3:.0f} ms, "
+          f"failure rate {args.failure_rate:.0%}; {len(links)} sheets, {args.repeat} repeats")
+    print(f"  {'stage':<22} {'n':>5} {'p50 ms':>9} {'p95 ms':>9}")
+    for label, values in samples.items():
+        p50, p95 = percentiles(values)
+        print(f"  {label:<22} {len(values):>5} {p50:>9.1f} {p95:>9.1f}")
+    print(f"  sheet downloads failed: {failures}")
+    print(f"  stand-in: {stats['requests']} requests, {stats['sheets']} sheets, {stats['images']} images, "
+          f"{stats['not_modified']} not modified, {stats['failures']} injected failures")
+    for error in errors:
+        print(f"  app exception: {error}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
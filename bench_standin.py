@@ -0,0 +1,210 @@
+"""Local stand-in for the Google Sheets CSV export and Google Drive image endpoints.
+
+Serves every sheet and image in the catalog from memory so the app's data
+path can be benchmarked without the network:
+
+    GET /spreadsheets/d/<sheet id>/export?format=csv   raw sheet in the export layouts seen in practice
+    GET /uc?export=view&id=<file id>                    PNG illustration (also /uc?id=...&export=download, /d/<id>)
+    GET /_stats                                         request, failure and byte counters as JSON
+
+Sheets carry an ETag and answer If-None-Match with 304, like the real
+export. Every request can be delayed (--latency plus up to --jitter
+seconds) and a share of them can fail with --failure-status
+(--failure-rate).
+
+Point the app at it with
+
+    python bench_standin.py --port 8765 --latency 0.2 --failure-rate 0.05
+    FED_SHEETS_BASE_URL=http://127.0.0.1:8765 FED_DRIVE_BASE_URL=http://127.0.0.1:8765 streamlit run FED_CODE.py
+"""
+import argparse
+import hashlib
+import io
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+from PIL import Image
+
+from bench_clean_data import synthetic_sheets
+from fed_catalog import CATALOG
+from fed_data import GENDERS
+
+IMAGE_SIZE = (1200, 900)
+
+
+def catalog_sheets():
+    """{sheet id: raw CSV bytes} for every sheet link in the catalog"""
+    ids = [link.split('/')[5] for gender in GENDERS for link in CATALOG.sheet_links(gender).values()]
+    sheets = synthetic_sheets(len(ids))
+    return {sheet_id: sheet.to_csv(index=False).encode() for sheet_id, sheet in zip(ids, sheets)}
+
+
+def synthetic_image(file_id, size=IMAGE_SIZE):
+    """Deterministic PNG for a Drive file ID, large enough to be worth thumbnailing"""
+    seed = int.from_bytes(hashlib.sha1(file_id.encode()).digest()[:4], "big")
+    width, height = size
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    pixels[..., 0] = (x + seed) % 256
+    pixels[..., 1] = (y + seed // 256) % 256
+    pixels[..., 2] = (x / 2 + y / 2 + seed // 65536) % 256
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class StandinServer:
+    """Threaded HTTP server imitating the Sheets export and Drive endpoints, with latency and failure injection"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, failure_rate=0.0, failure_status=503,
+                 seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.failure_status = failure_status
+        self.sheets = catalog_sheets()
+        self.etags = {sheet_id: f'"{hashlib.sha1(body).hexdigest()}"' for sheet_id, body in self.sheets.items()}
+        self.image_ids = {file_id for gender in GENDERS for file_id in CATALOG.image_links(gender).values()}
+        self._images = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "sheets": 0, "not_modified": 0, "images": 0, "failures": 0, "not_found": 0,
+                      "bytes": 0}
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fed-standin", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                self.stats[name] += value
+
+    def _delay_and_fail(self):
+        """Sleep for the configured latency; True if this request should fail"""
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            fail = self._random.random() < self.failure_rate
+        if delay > 0:
+            time.sleep(delay)
+        return fail
+
+    def image(self, file_id):
+        content = self._images.get(file_id)
+        if content is None:
+            content = self._images[file_id] = synthetic_image(file_id)
+        return content
+
+    def _handler(self):
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; without this, delayed ACKs add ~40 ms per response
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def send(self, status, body=b"", content_type="text/plain", headers=None):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                if body:
+                    self.wfile.write(body)
+                standin._count(bytes=len(body))
+
+            def do_GET(self):
+                standin._count(requests=1)
+                parts = urlsplit(self.path)
+                segments = [segment for segment in parts.path.split("/") if segment]
+                if segments == ["_stats"]:
+                    with standin._lock:
+                        body = json.dumps(standin.stats).encode()
+                    return self.send(200, body, "application/json")
+
+                if standin._delay_and_fail():
+                    standin._count(failures=1)
+                    return self.send(standin.failure_status, b"injected failure")
+
+                if len(segments) == 4 and segments[0] == "spreadsheets" and segments[3] == "export":
+                    sheet_id = segments[2]
+                    body = standin.sheets.get(sheet_id)
+                    if body is None:
+                        standin._count(not_found=1)
+                        return self.send(404, b"sheet not found")
+                    etag = standin.etags[sheet_id]
+                    if etag in self.headers.get("If-None-Match", ""):
+                        standin._count(not_modified=1)
+                        return self.send(304, headers={"ETag": etag})
+                    standin._count(sheets=1)
+                    return self.send(200, body, "text/csv", {"ETag": etag})
+
+                if segments == ["uc"]:
+                    file_id = parse_qs(parts.query).get("id", [""])[0]
+                elif len(segments) == 2 and segments[0] == "d":
+                    file_id = segments[1]
+                else:
+                    standin._count(not_found=1)
+                    return self.send(404, b"unknown endpoint")
+                if file_id not in standin.image_ids:
+                    standin._count(not_found=1)
+                    return self.send(404, b"file not found")
+                standin._count(images=1)
+                return self.send(200, standin.image(file_id), "image/png")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a local stand-in for Google Sheets and Drive")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra random seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="share of requests that fail (0-1)")
+    parser.add_argument("--failure-status", type=int, default=503)
+    args = parser.parse_args()
+
+    server = StandinServer(args.host, args.port, args.latency, args.jitter, args.failure_rate, args.failure_status)
+    print(f"Serving {len(server.sheets)} sheets and {len(server.image_ids)} images on {server.url}", flush=True)
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Joint accommodation of candidate equipment designs.
+
+A design is a set of dimensions, each tied to a body parameter with a
+bound:
+
+    min   the body measurement must be at least the dimension
+          (reach-type: a control at 1650 mm needs a vertical reach of 1650 mm or more)
+    max   the body measurement must be at most the dimension
+          (clearance-type: a 420 mm seat fits hip breadths up to 420 mm)
+
+The engine draws one virtual population per gender and region with the
+PopulationSynthesizer and scores every candidate design against the same
+individuals (common random numbers). Differences between designs then come
+from the designs and not from sampling noise. Scoring is vectorized over
+designs, genders, regions and individuals, so sweeping hundreds of
+candidates takes a fraction of a second.
+
+    python fed_accommodation.py designs.csv --constraint seat_width "HIP BREADTH" max \\
+        --constraint control_height "VERTICAL REACH" min --default-corr 0.3 -o accommodation.csv
+
+designs.csv has one column per dimension and one row per candidate design.
+"""
+import argparse
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from fed_catalog import CATALOG
+from fed_data import GENDERS
+from fed_population import PopulationSynthesizer
+from fed_query import DatasetQuery, default_loader, report_failures
+
+BOUNDS = ("min", "max")
+ACCOMMODATION_SAMPLES = 10000
+# Upper limit on comparisons held in memory at once while scoring designs
+CHUNK_VALUES = 1 << 24
+
+
+@dataclass(frozen=True, slots=True)
+class Constraint:
+    """One equipment dimension tied to a body parameter"""
+    dimension: str
+    parameter: str
+    bound: str
+
+    def __post_init__(self):
+        if self.bound not in BOUNDS:
+            raise ValueError(f"Bound for {self.dimension!r} must be 'min' or 'max', not {self.bound!r}")
+
+
+class AccommodationModel:
+    """Scores candidate designs against a fixed virtual population per gender and region"""
+
+    def __init__(self, query, constraints, correlations=None, default_correlation=0.0,
+                 samples=ACCOMMODATION_SAMPLES, seed=0, method="auto", errors="warn"):
+        self.constraints = tuple(constraints)
+        if not self.constraints:
+            raise ValueError("At least one constraint is needed")
+        dimensions = [constraint.dimension for constraint in self.constraints]
+        if len(set(dimensions)) != len(dimensions):
+            raise ValueError("Dimension names must be unique")
+
+        parameters = []
+        for constraint in self.constraints:
+            parameter = CATALOG.resolve(constraint.parameter)
+            if parameter is None:
+                raise KeyError(f"Unknown parameters: {constraint.parameter}")
+            if parameter.name not in parameters:
+                parameters.append(parameter.name)
+        synthesizer = PopulationSynthesizer(query, parameters, correlations, default_correlation, method, errors)
+        self.parameters = synthesizer.parameters
+        self.genders = synthesizer.genders
+        self.regions = synthesizer.regions
+        self.samples = samples
+
+        # (parameter, gender, region, individual), so each constraint reads one contiguous block
+        population = synthesizer.sample(samples, seed=seed)
+        self.measurements = np.ascontiguousarray(np.moveaxis(population, -1, 0))
+        self.columns = [self.parameters.index(CATALOG[constraint.parameter].name) for constraint in self.constraints]
+        # Genders and regions with data for every constrained parameter
+        self.has_data = ~np.isnan(self.measurements[:, :, :, 0]).any(axis=0)
+
+    @property
+    def dimensions(self):
+        return [constraint.dimension for constraint in self.constraints]
+
+    def _design_array(self, designs):
+        """(designs, constraints) float32 array from an array, a DataFrame or a list of {dimension: value}"""
+        if isinstance(designs, pd.DataFrame):
+            missing = [name for name in self.dimensions if name not in designs.columns]
+            if missing:
+                raise KeyError(f"Designs have no column for: {', '.join(missing)}")
+            values = designs[self.dimensions].to_numpy(dtype=np.float32)
+        elif isinstance(designs, dict) or (isinstance(designs, (list, tuple)) and designs
+                                           and isinstance(designs[0], dict)):
+            designs = [designs] if isinstance(designs, dict) else designs
+            values = np.array([[design[name] for name in self.dimensions] for design in designs], dtype=np.float32)
+        else:
+            values = np.atleast_2d(np.asarray(designs, dtype=np.float32))
+        if values.ndim != 2 or values.shape[1] != len(self.constraints):
+            raise ValueError(f"Each design needs {len(self.constraints)} values ({', '.join(self.dimensions)})")
+        return values
+
+    def accommodated(self, designs):
+        """Percentage of each gender and region accommodated by all constraints at once.
+
+        Returns an array of shape (designs, genders, regions), NaN where a
+        region has no data for one of the parameters.
+        """
+        values = self._design_array(designs)
+        _, genders, regions, samples = self.measurements.shape
+        result = np.empty((len(values), genders, regions), dtype=np.float64)
+        chunk = max(1, CHUNK_VALUES // (genders * regions * samples))
+        for start in range(0, len(values), chunk):
+            block = values[start:start + chunk]
+            ok = np.ones((len(block), genders, regions, samples), dtype=bool)
+            for i, (constraint, column) in enumerate(zip(self.constraints, self.columns)):
+                limit = block[:, i, None, None, None]
+                if constraint.bound == "min":
+                    ok &= self.measurements[column] >= limit
+                else:
+                    ok &= self.measurements[column] <= limit
+            result[start:start + chunk] = np.count_nonzero(ok, axis=-1) * (100.0 / samples)
+        result[:, ~self.has_data] = np.nan
+        return result
+
+    def frame(self, designs, dropna=True):
+        """Tidy DataFrame with one Design, Gender, State, Accommodated (%) row per design, gender and region"""
+        result = self.accommodated(designs)
+        design_index = designs.index if isinstance(designs, pd.DataFrame) else pd.RangeIndex(len(result))
+        index = pd.MultiIndex.from_product([design_index, self.genders, self.regions],
+                                           names=['Design', 'Gender', 'State'])
+        df = pd.DataFrame({'Accommodated (%)': result.ravel()}, index=index).reset_index()
+        if dropna:
+            df = df.dropna(subset=['Accommodated (%)']).reset_index(drop=True)
+        return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Joint accommodation of candidate equipment designs")
+    parser.add_argument("designs", help="CSV with one column per dimension and one row per design")
+    parser.add_argument("--constraint", nargs=3, action="append", required=True,
+                        metavar=("DIMENSION", "PARAMETER", "BOUND"),
+                        help="dimension column, body parameter and min or max (repeatable)")
+    parser.add_argument("--corr", nargs=3, action="append", default=[], metavar=("A", "B", "R"),
+                        help="correlation between two parameters (repeatable)")
+    parser.add_argument("--default-corr", type=float, default=0.0, help="correlation for unlisted pairs")
+    parser.add_argument("-n", "--samples", type=int, default=ACCOMMODATION_SAMPLES,
+                        help="virtual individuals per gender and region")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-g", "--genders", nargs="+", choices=GENDERS, help="default: both")
+    parser.add_argument("-r", "--regions", nargs="+", help="default: all")
+    parser.add_argument("-o", "--output", help="CSV file to write (default: stdout)")
+    args = parser.parse_args()
+
+    designs = pd.read_csv(args.designs)
+    query = DatasetQuery(default_loader())
+    try:
+        constraints = [Constraint(*values) for values in args.constraint]
+        model = AccommodationModel(query, constraints, {(a, b): float(r) for a, b, r in args.corr},
+                                   args.default_corr, samples=args.samples, seed=args.seed, errors="ignore")
+        df = model.frame(designs)
+    except (KeyError, ValueError) as e:
+        parser.error(e.args[0])
+
+    if args.genders:
+        df = df[df['Gender'].isin(args.genders)]
+    if args.regions:
+        df = df[df['State'].isin(args.regions)]
+    df.to_csv(args.output or sys.stdout, index=False, float_format="%.2f")
+    return report_failures(query.failures)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+"""Headless JSON API over the parameter catalog and data, for CAD plugins and scripts.
+
+The API serves the same dataset as the Streamlit app, through the same
+layers: the compiled catalog, the snapshot, the SheetLoader with its shared
+cache, the ParameterTensor and the SummaryIndex. Bodies are rendered once
+per URL and version of the sheets they were computed from, then cached. The
+ETag is a hash of the body, so it stays the same across workers and
+restarts for the same data. A client that sends If-None-Match gets a 304,
+and while the body is cached that 304 is answered without rebuilding it.
+Responses are gzip-compressed when the client accepts it.
+
+    python fed_api.py --port 8000
+    uvicorn fed_api:create_app --factory --port 8000
+
+Routes:
+
+    GET /catalog                              all parameters with IDs, applications and text
+    GET /regions
+    GET /parameters/{id}                      one catalog entry
+    GET /parameters/{id}/{gender}             per-region statistics (?regions=a,b&stats=Mean)
+    GET /parameters/{id}/{gender}/summary     mean, min, max, spread and extreme states across regions
+    GET /parameters/{id}/{gender}/percentiles estimated values at any percentiles (?q=1,50,99&regions=a,b)
+    GET /parameters/{id}/delta                male minus female mean of each statistic
+    GET /aggregates                           summary of every parameter (?genders=Male&stats=Mean)
+    GET /query                                tidy rows for any parameters x genders x regions x stats
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import threading
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.responses import Response
+from starlette.routing import Route
+
+from fed_bundle import OFFLINE_BUNDLE, OfflineBundle
+from fed_catalog import CATALOG
+from fed_data import GENDERS
+from fed_percentiles import z_scores
+from fed_query import DatasetQuery, default_loader
+from fed_refresh import SheetRefresher
+from fed_snapshot import SnapshotStore
+
+# Rendered response bodies kept per (URL, data version)
+API_CACHE_ENTRIES = int(os.environ.get("FED_API_CACHE_ENTRIES", 4096))
+GZIP_MIN_BYTES = 500
+
+
+def _clean(value):
+    """JSON-safe copy of value: NaN becomes null, floats are rounded and NumPy scalars become Python numbers"""
+    if isinstance(value, dict):
+        return {key: _clean(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_clean(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        # Values are stored as float32; four decimals is more than the source sheets carry
+        return None if math.isnan(value) else round(value, 4)
+    return value
+
+
+def _split(value):
+    """Comma-separated query parameter as a list, or None when absent"""
+    if value is None:
+        return None
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+class ApiError(Exception):
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class ResponseCache:
+    """Small thread-safe LRU of (etag, body) keyed by (URL, data version)"""
+
+    def __init__(self, max_entries=API_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+
+class DataApi:
+    """Route handlers bound to one SheetLoader"""
+
+    def __init__(self, loader, cache=None):
+        self.loader = loader
+        self.query = DatasetQuery(loader)
+        self.cache = cache if cache is not None else ResponseCache()
+
+    # Helpers
+
+    def parameter(self, parameter_id):
+        parameter = CATALOG.resolve(parameter_id)
+        if parameter is None:
+            raise ApiError(404, f"Unknown parameter: {parameter_id}")
+        return parameter
+
+    def gender(self, value):
+        for gender in GENDERS:
+            if gender.lower() == value.lower():
+                return gender
+        raise ApiError(404, f"Unknown gender: {value}")
+
+    def data_version(self, parameters, genders):
+        """Versions of the sheets a response depends on, as a hashable tuple"""
+        tensor = self.loader.tensor
+        p, g, _, _ = tensor.indices(parameters, genders)
+        return (id(tensor),) + tuple(tensor.sheet_versions[np.ix_(p, g)].ravel().tolist())
+
+    def respond(self, request, version, render):
+        """Serve a cached or freshly rendered JSON body for request, honouring If-None-Match"""
+        key = (str(request.url.path), str(request.url.query), version)
+        entry = self.cache.get(key)
+        if entry is None:
+            body = json.dumps(_clean(render()), separators=(",", ":"), allow_nan=False).encode()
+            entry = self.cache.put(key, (f'"{hashlib.sha1(body).hexdigest()}"', body))
+        etag, body = entry
+
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    def load(self, parameters, genders):
+        failures = self.query.ensure_loaded(parameters, genders)
+        if failures and len(failures) == len(parameters) * len(genders):
+            raise ApiError(502, "; ".join(f"{gender}/{parameter}: {error}"
+                                          for (parameter, gender), error in failures.items()))
+
+    @staticmethod
+    def catalog_entry(parameter):
+        return {
+            "id": parameter.id,
+            "name": parameter.name,
+            "applications": list(parameter.applications),
+            "definition": parameter.definition,
+            "design_guide": parameter.design_guide,
+            "genders": [gender for gender in GENDERS if parameter.sheet_link(gender) is not None],
+            "images": {gender: parameter.image_id(gender) for gender in GENDERS
+                       if parameter.image_id(gender) is not None},
+        }
+
+    # Routes
+
+    def catalog(self, request):
+        return self.respond(request, (), lambda: [self.catalog_entry(p) for p in CATALOG])
+
+    def regions(self, request):
+        return self.respond(request, (), lambda: list(CATALOG.regions))
+
+    def parameter_info(self, request):
+        parameter = self.parameter(request.path_params["parameter"])
+        return self.respond(request, (), lambda: self.catalog_entry(parameter))
+
+    def parameter_values(self, request):
+        parameter = self.parameter(request.path_params["parameter"])
+        gender = self.gender(request.path_params["gender"])
+        try:
+            _, _, regions, stats = self.query.resolve([parameter.name], [gender],
+                                                      _split(request.query_params.get("regions")),
+                                                      _split(request.query_params.get("stats")))
+        except KeyError as e:
+            raise ApiError(400, e.args[0])
+        self.load([parameter.name], [gender])
+
+        def render():
+            df = self.loader.tensor.frame(parameter.name, gender, regions)
+            return {"parameter": parameter.id, "name": parameter.name, "gender": gender,
+                    "values": df[['State'] + stats].to_dict(orient="records")}
+
+        return self.respond(request, self.data_version([parameter.name], [gender]), render)
+
+    def parameter_summary(self, request):
+        parameter = self.parameter(request.path_params["parameter"])
+        gender = self.gender(request.path_params["gender"])
+        self.load([parameter.name], [gender])
+        return self.respond(request, self.data_version([parameter.name], [gender]), lambda: {
+            "parameter": parameter.id, "name": parameter.name, "gender": gender,
+            "summary": self.loader.summary_index().summary(parameter.name, gender),
+        })
+
+    def parameter_percentiles(self, request):
+        parameter = self.parameter(request.path_params["parameter"])
+        gender = self.gender(request.path_params["gender"])
+        try:
+            percentiles = [float(q) for q in _split(request.query_params.get("q")) or ["1", "50", "99"]]
+            z_scores(percentiles)
+            _, _, regions, _ = self.query.resolve([parameter.name], [gender],
+                                                  _split(request.query_params.get("regions")), None)
+        except ValueError as e:
+            raise ApiError(400, f"Invalid percentiles: {e}")
+        except KeyError as e:
+            raise ApiError(400, e.args[0])
+        self.load([parameter.name], [gender])
+
+        def render():
+            tensor = self.loader.tensor
+            model = self.loader.percentile_model()
+            p, g = tensor.param_index[parameter.name], tensor.gender_index[gender]
+            r = tensor.indices(regions=regions)[2]
+            estimates = model.quantiles(percentiles)[p, g, r]
+            return {"parameter": parameter.id, "name": parameter.name, "gender": gender,
+                    "percentiles": percentiles,
+                    "values": [{"State": tensor.regions[i],
+                                "model": "lognormal" if model.lognormal[p, g, i] else "normal",
+                                "estimates": row.tolist()}
+                               for i, row in zip(r, estimates) if not np.isnan(row).all()]}
+
+        return self.respond(request, self.data_version([parameter.name], [gender]), render)
+
+    def parameter_delta(self, request):
+        parameter = self.parameter(request.path_params["parameter"])
+        self.load([parameter.name], list(GENDERS))
+        return self.respond(request, self.data_version([parameter.name], list(GENDERS)), lambda: {
+            "parameter": parameter.id, "name": parameter.name,
+            "male_minus_female": self.loader.summary_index().delta(parameter.name),
+        })
+
+    def aggregates(self, request):
+        try:
+            parameters, genders, _, stats = self.query.resolve(
+                _split(request.query_params.get("parameters")), _split(request.query_params.get("genders")),
+                None, _split(request.query_params.get("stats")))
+        except KeyError as e:
+            raise ApiError(400, e.args[0])
+        self.load(parameters, genders)
+
+        def render():
+            index = self.loader.summary_index()
+            result = []
+            for name in parameters:
+                for gender in genders:
+                    summary = index.summary(name, gender)
+                    result.append({"parameter": CATALOG[name].id, "name": name, "gender": gender,
+                                   "summary": {stat: summary[stat] for stat in stats}})
+            return result
+
+        return self.respond(request, self.data_version(parameters, genders), render)
+
+    def tidy_query(self, request):
+        params = request.query_params
+        try:
+            parameters, genders, regions, stats = self.query.resolve(
+                _split(params.get("parameters")), _split(params.get("genders")),
+                _split(params.get("regions")), _split(params.get("stats")))
+        except KeyError as e:
+            raise ApiError(400, e.args[0])
+        self.load(parameters, genders)
+        # load() has already decided how to answer failed sheets; the rest are served as missing values
+        return self.respond(request, self.data_version(parameters, genders), lambda: self.query.frame(
+            parameters, genders, regions, stats, errors="ignore").to_dict(orient="records"))
+
+    def routes(self):
+        def handle(method):
+            def endpoint(request):
+                try:
+                    return method(request)
+                except ApiError as e:
+                    body = json.dumps({"error": str(e)}).encode()
+                    return Response(body, status_code=e.status_code, media_type="application/json")
+            return endpoint
+
+        return [
+            Route("/catalog", handle(self.catalog)),
+            Route("/regions", handle(self.regions)),
+            Route("/aggregates", handle(self.aggregates)),
+            Route("/query", handle(self.tidy_query)),
+            Route("/parameters/{parameter}", handle(self.parameter_info)),
+            Route("/parameters/{parameter}/delta", handle(self.parameter_delta)),
+            Route("/parameters/{parameter}/{gender}", handle(self.parameter_values)),
+            Route("/parameters/{parameter}/{gender}/summary", handle(self.parameter_summary)),
+            Route("/parameters/{parameter}/{gender}/percentiles", handle(self.parameter_percentiles)),
+        ]
+
+
+def create_app(loader=None, refresh=True):
+    """Starlette app over loader, or over the local snapshot (or FED_OFFLINE_BUNDLE) when loader is None"""
+    refresher = None
+    if loader is None:
+        links = {gender: CATALOG.sheet_links(gender) for gender in GENDERS}
+        if OFFLINE_BUNDLE:
+            bundle = OfflineBundle(OFFLINE_BUNDLE)
+            loader = default_loader(SnapshotStore(links, path=bundle.snapshot_path, max_age=float("inf")),
+                                    fetch=bundle.read_sheet)
+        else:
+            loader = default_loader()
+            if refresh:
+                loader.snapshot_store.refresh_if_stale()
+                refresher = SheetRefresher(links, loader.snapshot_store, loader)
+
+    @asynccontextmanager
+    async def lifespan(app):
+        if refresher is not None:
+            refresher.start()
+        yield
+        if refresher is not None:
+            refresher.stop()
+
+    api = DataApi(loader)
+    app = Starlette(routes=api.routes(), middleware=[Middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES)],
+                    lifespan=lifespan)
+    app.state.api = api
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the anthropometric data as a JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    import uvicorn
+    if args.workers > 1:
+        uvicorn.run("fed_api:create_app", factory=True, host=args.host, port=args.port, workers=args.workers)
+    else:
+        uvicorn.run(create_app(), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""Offline bundle of every parameter sheet and illustration.
+
+A bundle is a versioned directory that holds everything the app needs to
+run without network access:
+
+    OUT_DIR/
+        CURRENT                  name of the newest bundle version
+        20261018-120000/
+            manifest.json        version, build info and a SHA-256 checksum per file
+            sheets.feather       all sheets in the snapshot format
+            images/<file id>     original Drive images
+            thumbnails/...       pre-sized thumbnails for the Quick Stats and comparison views
+
+Build one with
+
+    python fed_bundle.py OUT_DIR
+
+and point the app at it with FED_OFFLINE_BUNDLE=OUT_DIR (or a specific
+version directory). In offline mode sheets and images are served from the
+bundle only, and nothing is fetched from Google Sheets or Drive.
+
+    python fed_bundle.py --verify OUT_DIR
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from fed_catalog import CATALOG
+from fed_data import GENDERS
+from fed_images import ImageCache
+from fed_prefetch import make_session, prefetch_sheets
+from fed_snapshot import write_snapshot
+from fed_thumbnails import THUMBNAIL_WIDTHS, ThumbnailCache
+
+logger = logging.getLogger(__name__)
+
+# Bundle directory to serve from instead of the network; unset means online mode
+OFFLINE_BUNDLE = os.environ.get("FED_OFFLINE_BUNDLE")
+
+BUNDLE_FORMAT = 1
+MANIFEST_NAME = "manifest.json"
+CURRENT_NAME = "CURRENT"
+SHEETS_NAME = "sheets.feather"
+IMAGE_WORKERS = 8
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def resolve_bundle_path(path):
+    """Version directory for path, which may be a version directory or a bundle root with a CURRENT file"""
+    if os.path.exists(os.path.join(path, MANIFEST_NAME)):
+        return path
+    with open(os.path.join(path, CURRENT_NAME), encoding="utf-8") as f:
+        return os.path.join(path, f.read().strip())
+
+
+def build_bundle(out_dir, sheet_links_by_gender, image_links_by_gender, widths=THUMBNAIL_WIDTHS,
+                 image_cache=None, progress=None):
+    """Download every sheet and image into a new version directory under out_dir and mark it current.
+
+    progress, if given, is called as progress(stage, done, total). Returns
+    the path of the new version directory.
+    """
+    version = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+    target = os.path.join(out_dir, version)
+    staging = os.path.join(out_dir, f".{version}.{os.getpid()}.tmp")
+    os.makedirs(staging)
+    try:
+        start = time.perf_counter()
+        frames, sheet_failures = prefetch_sheets(
+            sheet_links_by_gender,
+            progress=(lambda done, total, key, error: progress("sheets", done, total)) if progress else None
+        )
+        sheet_failures = {f"{gender}/{parameter}": error for (parameter, gender), error in sheet_failures.items()}
+        write_snapshot(frames, os.path.join(staging, SHEETS_NAME), sheet_failures)
+        logger.info("Bundled %d sheets in %.1fs", len(frames), time.perf_counter() - start)
+
+        image_cache = image_cache if image_cache is not None else ImageCache()
+        image_dir = os.path.join(staging, "images")
+        os.makedirs(image_dir)
+        thumbnails = ThumbnailCache(image_cache, root=os.path.join(staging, "thumbnails"))
+        file_ids = sorted({file_id for gender in GENDERS for file_id in image_links_by_gender.get(gender, {}).values()})
+        session = make_session(IMAGE_WORKERS)
+
+        def bundle_image(file_id):
+            content = image_cache.fetch(file_id, session)
+            if content is None:
+                return False
+            with open(os.path.join(image_dir, file_id), "wb") as f:
+                f.write(content)
+            return all([thumbnails.get(file_id, width) is not None for width in widths])
+
+        image_failures = []
+        try:
+            with ThreadPoolExecutor(max_workers=IMAGE_WORKERS, thread_name_prefix="fed-bundle") as pool:
+                for done, (file_id, ok) in enumerate(zip(file_ids, pool.map(bundle_image, file_ids)), start=1):
+                    if not ok:
+                        image_failures.append(file_id)
+                    if progress is not None:
+                        progress("images", done, len(file_ids))
+        finally:
+            session.close()
+        logger.info("Bundled %d images in %.1fs", len(file_ids) - len(image_failures), time.perf_counter() - start)
+
+        files = {}
+        for root, _, names in os.walk(staging):
+            for name in names:
+                path = os.path.join(root, name)
+                files[os.path.relpath(path, staging).replace(os.sep, "/")] = {
+                    "sha256": file_sha256(path),
+                    "bytes": os.path.getsize(path),
+                }
+        manifest = {
+            "format": BUNDLE_FORMAT,
+            "version": version,
+            "built_at": time.time(),
+            "sheets": {"count": len(frames), "failures": sheet_failures},
+            "images": {"count": len(file_ids) - len(image_failures), "failures": image_failures},
+            "thumbnails": {"format": thumbnails.image_format, "widths": list(widths)},
+            "files": dict(sorted(files.items())),
+        }
+        with open(os.path.join(staging, MANIFEST_NAME), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=1)
+
+        os.replace(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    current_tmp = os.path.join(out_dir, f"{CURRENT_NAME}.{os.getpid()}.tmp")
+    with open(current_tmp, "w", encoding="utf-8") as f:
+        f.write(version + "\n")
+    os.replace(current_tmp, os.path.join(out_dir, CURRENT_NAME))
+    return target
+
+
+class OfflineBundle:
+    """Read-only access to one bundle version; stands in for the ImageCache and the sheet downloader"""
+
+    def __init__(self, path):
+        self.path = resolve_bundle_path(path)
+        with open(os.path.join(self.path, MANIFEST_NAME), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format") != BUNDLE_FORMAT:
+            raise ValueError(f"Unsupported bundle format {self.manifest.get('format')!r} in {self.path}")
+        self.version = self.manifest["version"]
+        self.snapshot_path = os.path.join(self.path, SHEETS_NAME)
+        self.image_dir = os.path.join(self.path, "images")
+        self.thumbnail_dir = os.path.join(self.path, "thumbnails")
+        self.thumbnail_format = self.manifest["thumbnails"]["format"]
+
+    def fetch(self, file_id, session=None):
+        """Original image bytes for a Drive file ID, or None if the bundle does not have it"""
+        try:
+            with open(os.path.join(self.image_dir, os.path.basename(file_id)), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def read_sheet(self, sheet_url, session=None):
+        """Sheet loader fallback: every sheet the bundle has is already in its snapshot"""
+        raise LookupError(f"Sheet is not in offline bundle {self.version}")
+
+    def verify(self, checksums=True):
+        """List of problems with the bundle files: missing, wrong size or (with checksums) wrong SHA-256"""
+        problems = []
+        for name, expected in self.manifest["files"].items():
+            path = os.path.join(self.path, *name.split("/"))
+            if not os.path.exists(path):
+                problems.append(f"{name}: missing")
+            elif os.path.getsize(path) != expected["bytes"]:
+                problems.append(f"{name}: expected {expected['bytes']} bytes, found {os.path.getsize(path)}")
+            elif checksums and file_sha256(path) != expected["sha256"]:
+                problems.append(f"{name}: checksum mismatch")
+        return problems
+
+    def status(self):
+        built = datetime.fromtimestamp(self.manifest["built_at"], tz=timezone.utc)
+        return (f"offline bundle {self.version}: {self.manifest['sheets']['count']} sheets, "
+                f"{self.manifest['images']['count']} images, built {built:%Y-%m-%d %H:%M} UTC")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or verify an offline data bundle")
+    parser.add_argument("out_dir", help="bundle root directory")
+    parser.add_argument("--verify", action="store_true", help="check the current bundle against its manifest")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.verify:
+        bundle = OfflineBundle(args.out_dir)
+        problems = bundle.verify()
+        print(bundle.status())
+        for problem in problems:
+            print(f"  {problem}")
+        return 1 if problems else 0
+
+    sheet_links = {gender: CATALOG.sheet_links(gender) for gender in GENDERS}
+    image_links = {gender: CATALOG.image_links(gender) for gender in GENDERS}
+
+    def report(stage, done, total):
+        if done == total or done % 20 == 0:
+            print(f"  {stage}: {done}/{total}", flush=True)
+
+    path = build_bundle(args.out_dir, sheet_links, image_links, progress=report)
+    bundle = OfflineBundle(path)
+    print(bundle.status())
+    for sheet, error in bundle.manifest["sheets"]["failures"].items():
+        print(f"  sheet {sheet}: {error}")
+    for file_id in bundle.manifest["images"]["failures"]:
+        print(f"  image {file_id}: not available")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
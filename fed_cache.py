@@ -0,0 +1,89 @@
+"""Process-wide, memory-bounded cache of parameter DataFrames.
+
+One instance is shared by every Streamlit session in the process, so memory
+grows with the number of distinct sheets rather than sessions x sheets.
+Entries are evicted least-recently-used once the total DataFrame size passes
+max_bytes, and expire after ttl seconds.
+
+Cached DataFrames are shared objects: treat them as read-only and copy before
+modifying.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+DATA_CACHE_BYTES = int(os.environ.get("FED_DATA_CACHE_BYTES", 64 * 1024 * 1024))
+DATA_CACHE_TTL = float(os.environ.get("FED_DATA_CACHE_TTL", 60 * 60))
+
+
+def frame_nbytes(df):
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class DataFrameCache:
+    """Thread-safe LRU cache of DataFrames with a byte ceiling and a TTL"""
+
+    def __init__(self, max_bytes=DATA_CACHE_BYTES, ttl=DATA_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return self.get(key, count=False) is not None
+
+    def get(self, key, count=True):
+        """Return the cached DataFrame for key, or None if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[2] > self.ttl:
+                self._drop(key)
+                entry = None
+            if count:
+                if entry is None:
+                    self.misses += 1
+                else:
+                    self.hits += 1
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, df):
+        """Store df under key, evicting least recently used entries to stay under max_bytes"""
+        size = frame_nbytes(df)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self.max_bytes:
+                return df
+            self._entries[key] = (df, size, time.monotonic())
+            self.nbytes += size
+            while self.nbytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+        return df
+
+    def discard(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def _drop(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.nbytes -= size
+
+    def stats(self):
+        return {"entries": len(self._entries), "bytes": self.nbytes, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
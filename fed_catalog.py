@@ -0,0 +1,265 @@
+"""Immutable parameter catalog, compiled once per process.
+
+The hand-edited dicts in fed_catalog_data are compiled at import into one
+frozen Parameter record per parameter and read-only mapping views that keep
+the original dict names. Every key is normalized (case and whitespace) and
+passed through the alias table before it is merged, so a misspelled key in
+one dict lands on the same parameter as the correct spelling in the others.
+Each parameter also gets a stable slug ID. Catalog.resolve() maps any
+spelling, alias or ID to its Parameter with a single dict lookup.
+
+At load time a validation report checks the seven dicts against each other,
+including keys repeated inside one literal (which Python silently
+collapses), and logs what it finds. Python imports the module once per
+process, so a Streamlit rerun only executes UI code and not the 1,400 lines
+of literals.
+"""
+import ast
+import logging
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+import fed_catalog_data as _data
+from fed_data import GENDERS
+
+logger = logging.getLogger(__name__)
+
+SHEET_URL_MARKER = "/spreadsheets/d/"
+SOURCE_DICTS = ("male_parameter_data_links", "female_parameter_data_links", "application_data", "definition_data",
+                "design_guide_data", "male_image_data_links", "female_image_data_links")
+
+_NON_ID = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name):
+    """Case- and whitespace-insensitive form of a parameter name"""
+    return " ".join(str(name).split()).upper()
+
+
+def parameter_id(name):
+    """Stable slug ID for a parameter name, e.g. HAND GRIP TORQUE (PREFERRED HAND) -> hand_grip_torque_preferred_hand"""
+    return _NON_ID.sub("_", normalize_name(name).lower()).strip("_")
+
+
+@dataclass(frozen=True, slots=True)
+class Parameter:
+    """Everything the catalog knows about one parameter"""
+    id: str
+    name: str
+    applications: tuple = ()
+    definition: str = ""
+    design_guide: str = ""
+    male_sheet: str = None
+    female_sheet: str = None
+    male_image: str = None
+    female_image: str = None
+
+    def sheet_link(self, gender):
+        return self.male_sheet if gender == "Male" else self.female_sheet
+
+    def image_id(self, gender):
+        return self.male_image if gender == "Male" else self.female_image
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class Catalog:
+    """Parameter records in catalog order plus name, ID and alias indexes"""
+    parameters: tuple
+    regions: tuple
+    by_name: MappingProxyType
+    # Normalized name, alias or ID -> Parameter
+    lookup: MappingProxyType
+    # Source dict name -> ((key as written, canonical name), ...) for keys that needed an alias
+    aliased_keys: MappingProxyType = field(default_factory=lambda: MappingProxyType({}))
+    # (source dict name, key as written, canonical name) for spellings that clashed with a different value
+    conflicts: tuple = ()
+
+    def resolve(self, name):
+        """Parameter for a canonical name, alternative spelling, alias or ID; None if unknown"""
+        parameter = self.by_name.get(name)
+        if parameter is None:
+            parameter = self.lookup.get(normalize_name(name))
+        if parameter is None:
+            parameter = self.lookup.get(str(name).lower())
+        return parameter
+
+    def __getitem__(self, name):
+        parameter = self.resolve(name)
+        if parameter is None:
+            raise KeyError(name)
+        return parameter
+
+    def __contains__(self, name):
+        return self.resolve(name) is not None
+
+    def __iter__(self):
+        return iter(self.parameters)
+
+    def __len__(self):
+        return len(self.parameters)
+
+    def names(self):
+        return tuple(parameter.name for parameter in self.parameters)
+
+    def sheet_links(self, gender):
+        """Read-only {parameter: sheet url} for one gender"""
+        return MappingProxyType({p.name: p.sheet_link(gender) for p in self.parameters
+                                 if p.sheet_link(gender) is not None})
+
+    def image_links(self, gender):
+        """Read-only {parameter: Drive file ID} for one gender"""
+        return MappingProxyType({p.name: p.image_id(gender) for p in self.parameters
+                                 if p.image_id(gender) is not None})
+
+
+def compile_catalog(sheet_links, application_data, definition_data, design_guide_data, image_links, regions,
+                    aliases=None):
+    """Build a Catalog from the source dicts. sheet_links and image_links are {gender: {parameter: value}},
+    aliases is {alternative spelling: canonical name}.
+
+    Parameters are ordered as in application_data, followed by names that
+    only appear in the other dicts. Keys that normalize to the same
+    canonical name are merged into one parameter.
+    """
+    alias_table = {normalize_name(alias): normalize_name(name) for alias, name in (aliases or {}).items()}
+    sources = {
+        "male_parameter_data_links": sheet_links.get("Male", {}),
+        "female_parameter_data_links": sheet_links.get("Female", {}),
+        "application_data": application_data,
+        "definition_data": definition_data,
+        "design_guide_data": design_guide_data,
+        "male_image_data_links": image_links.get("Male", {}),
+        "female_image_data_links": image_links.get("Female", {}),
+    }
+
+    names = {}
+    values = {}
+    aliased_keys = {}
+    conflicts = []
+    for source_name in ["application_data", *(name for name in SOURCE_DICTS if name != "application_data")]:
+        canonical_values = values[source_name] = {}
+        for key, value in sources[source_name].items():
+            name = alias_table.get(normalize_name(key), normalize_name(key))
+            if name != key:
+                aliased_keys.setdefault(source_name, []).append((key, name))
+            if name in canonical_values:
+                # Two spellings of one parameter in the same dict; the first one wins
+                if canonical_values[name] != value:
+                    conflicts.append((source_name, key, name))
+                continue
+            canonical_values[name] = value
+            names.setdefault(name, None)
+
+    records = []
+    for name in names:
+        records.append(Parameter(
+            id=parameter_id(name),
+            name=name,
+            applications=tuple(values["application_data"].get(name, ())),
+            definition=values["definition_data"].get(name, ""),
+            design_guide=values["design_guide_data"].get(name, ""),
+            male_sheet=values["male_parameter_data_links"].get(name),
+            female_sheet=values["female_parameter_data_links"].get(name),
+            male_image=values["male_image_data_links"].get(name),
+            female_image=values["female_image_data_links"].get(name),
+        ))
+
+    lookup = {}
+    for record in records:
+        lookup[record.name] = record
+        lookup[record.id] = record
+    for alias, name in alias_table.items():
+        if name in lookup:
+            lookup.setdefault(alias, lookup[name])
+            lookup.setdefault(parameter_id(alias), lookup[name])
+    return Catalog(
+        parameters=tuple(records),
+        regions=tuple(regions),
+        by_name=MappingProxyType({record.name: record for record in records}),
+        lookup=MappingProxyType(lookup),
+        aliased_keys=MappingProxyType({source: tuple(keys) for source, keys in aliased_keys.items()}),
+        conflicts=tuple(conflicts),
+    )
+
+
+def find_duplicate_keys(path):
+    """{dict name: [key, ...]} for keys written more than once in a literal dict in the source file at path"""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    duplicates = {}
+    for node in tree.body:
+        if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)
+                and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)):
+            continue
+        seen = set()
+        for key in node.value.keys:
+            if isinstance(key, ast.Constant):
+                if key.value in seen:
+                    duplicates.setdefault(node.targets[0].id, []).append(key.value)
+                seen.add(key.value)
+    return duplicates
+
+
+def check_catalog(catalog, source_path=None):
+    """List of human-readable inconsistencies between the source dicts"""
+    issues = []
+    if source_path is not None:
+        for source, keys in find_duplicate_keys(source_path).items():
+            for key in keys:
+                issues.append(f"{source}: key {key!r} is written more than once; only the last value is used")
+    for source, key, name in catalog.conflicts:
+        issues.append(f"{source}: {key!r} and another spelling of {name!r} have different values; {key!r} is ignored")
+    for parameter in catalog:
+        missing = []
+        if not parameter.applications:
+            missing.append("applications")
+        if not parameter.definition:
+            missing.append("definition")
+        if not parameter.design_guide:
+            missing.append("design guide")
+        for gender in GENDERS:
+            if parameter.sheet_link(gender) is None:
+                missing.append(f"{gender.lower()} sheet")
+            if parameter.image_id(gender) is None:
+                missing.append(f"{gender.lower()} image")
+        if missing:
+            issues.append(f"{parameter.name}: no {', '.join(missing)}")
+
+        for gender in GENDERS:
+            link = parameter.sheet_link(gender)
+            if link is not None and SHEET_URL_MARKER not in link:
+                issues.append(f"{parameter.name}: {gender.lower()} sheet link is not a Google Sheets URL")
+            file_id = parameter.image_id(gender)
+            if file_id is not None and (not file_id or "/" in file_id):
+                issues.append(f"{parameter.name}: {gender.lower()} image ID {file_id!r} is not a Drive file ID")
+
+    if len(set(catalog.regions)) != len(catalog.regions):
+        issues.append("regions: duplicate names")
+    return issues
+
+
+CATALOG = compile_catalog(
+    {"Male": _data.male_parameter_data_links, "Female": _data.female_parameter_data_links},
+    _data.application_data,
+    _data.definition_data,
+    _data.design_guide_data,
+    {"Male": _data.male_image_data_links, "Female": _data.female_image_data_links},
+    _data.regions,
+    aliases=_data.parameter_aliases,
+)
+CATALOG_ISSUES = tuple(check_catalog(CATALOG, _data.__file__))
+if CATALOG_ISSUES:
+    logger.warning("Parameter catalog has %d inconsistencies:\n  %s", len(CATALOG_ISSUES), "\n  ".join(CATALOG_ISSUES))
+for _source, _keys in CATALOG.aliased_keys.items():
+    logger.info("%s: resolved %s", _source, ", ".join(f"{key!r} -> {name!r}" for key, name in _keys))
+
+# Read-only views under the original dict names
+male_parameter_data_links = CATALOG.sheet_links("Male")
+female_parameter_data_links = CATALOG.sheet_links("Female")
+male_image_data_links = CATALOG.image_links("Male")
+female_image_data_links = CATALOG.image_links("Female")
+application_data = MappingProxyType({p.name: p.applications for p in CATALOG if p.applications})
+definition_data = MappingProxyType({p.name: p.definition for p in CATALOG if p.definition})
+design_guide_data = MappingProxyType({p.name: p.design_guide for p in CATALOG if p.design_guide})
+regions = CATALOG.regions
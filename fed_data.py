@@ -0,0 +1,116 @@
+"""Sheet download and cleaning helpers shared by the app and its background jobs.
+
+Nothing in here touches Streamlit, so these functions are safe to call from
+worker threads and command-line tools.
+"""
+import functools
+import io
+import logging
+import os
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Local cache directory for snapshots and other derived data
+CACHE_DIR = os.environ.get(
+    "FED_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".fed_cache")
+)
+
+GENDERS = ("Male", "Female")
+STAT_COLUMNS = ['5th Percentile', 'Mean', '95th Percentile']
+SHEET_TIMEOUT = 30
+# Host serving the CSV exports; point it at a stand-in server (bench_standin.py) for benchmarks
+SHEETS_BASE_URL = os.environ.get("FED_SHEETS_BASE_URL", "https://docs.google.com").rstrip("/")
+
+
+def sheet_csv_url(sheet_url):
+    """Turn a Google Sheets share link into its CSV export URL"""
+    sheet_id = sheet_url.split('/')[5]
+    return f"{SHEETS_BASE_URL}/spreadsheets/d/{sheet_id}/export?format=csv"
+
+
+def read_sheet(sheet_url, session=None):
+    """Download one parameter sheet and return it cleaned. Raises on network errors."""
+    response = (session or requests).get(sheet_csv_url(sheet_url), timeout=SHEET_TIMEOUT)
+    response.raise_for_status()
+    return parse_sheet(response.content)
+
+
+def parse_sheet(content):
+    """Parse downloaded CSV bytes into a cleaned sheet"""
+    return clean_data(pd.read_csv(io.BytesIO(content)))
+
+
+# Sheet layout resolved once per distinct set of column names
+SheetSchema = namedtuple("SheetSchema", ["renames", "numeric_columns"])
+
+_NON_NUMERIC = r'[^\d.-]'
+
+
+@functools.lru_cache(maxsize=256)
+def resolve_schema(columns):
+    """Work out column renames and numeric columns for a sheet layout given as a tuple of column names"""
+    renames = {}
+    numeric_columns = [col for col in STAT_COLUMNS if col in columns]
+
+    if not numeric_columns:
+        potential_cols = [col for col in columns if any(
+            keyword in str(col).lower() for keyword in ['percentile', 'mean', 'average', '5th', '95th']
+        )]
+        if len(potential_cols) >= 3:
+            renames.update(zip(potential_cols[:3], STAT_COLUMNS))
+            numeric_columns = list(STAT_COLUMNS)
+
+    renamed = [renames.get(col, col) for col in columns]
+    if 'State' not in renamed:
+        potential_state_cols = [col for col in columns if renames.get(col, col) not in STAT_COLUMNS and any(
+            keyword in str(col).lower() for keyword in ['state', 'region', 'location', 'area']
+        )]
+        if potential_state_cols:
+            renames[potential_state_cols[0]] = 'State'
+
+    return SheetSchema(renames, tuple(numeric_columns))
+
+
+def coerce_numeric(series):
+    """Convert a column to float64, stripping units and other non-numeric characters from text"""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype('float64')
+    stripped = series.astype(str).str.replace(_NON_NUMERIC, '', regex=True)
+    return pd.to_numeric(stripped, errors='coerce').astype('float64')
+
+
+# Data cleaning function
+def clean_data(df):
+    """Clean and convert data types for proper analysis.
+
+    Sheets that are already clean are returned as they are, without a copy.
+    """
+    try:
+        schema = resolve_schema(tuple(df.columns))
+        df_clean = df.rename(columns=schema.renames) if schema.renames else df
+        numeric_cols = list(schema.numeric_columns)
+        if not numeric_cols:
+            return df_clean
+
+        converted = {col: coerce_numeric(df_clean[col]) for col in numeric_cols
+                     if df_clean[col].dtype != 'float64'}
+        if converted:
+            df_clean = df_clean.assign(**converted)
+
+        has_values = np.zeros(len(df_clean), dtype=bool)
+        for col in numeric_cols:
+            has_values |= ~np.isnan(df_clean[col].to_numpy())
+        if not has_values.all():
+            df_clean = df_clean[has_values]
+
+        return df_clean
+
+    except Exception as e:
+        logger.warning("Data cleaning warning: %s", e)
+        return df
@@ -0,0 +1,182 @@
+"""Disk-backed cache for parameter illustrations hosted on Google Drive.
+
+Image bytes are stored content-addressed (by SHA-256) under CACHE_DIR/images
+and indexed in a small SQLite database, so the cache survives restarts and is
+shared by every worker process on the host. The total size of stored images is
+kept under a byte budget by evicting the least recently used blobs. For each
+Drive file ID the cache also remembers which URL variant worked last time, and
+failed IDs are remembered for a while so they are not retried on every page
+load.
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+import requests
+
+from fed_data import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+IMAGE_CACHE_DIR = os.path.join(CACHE_DIR, "images")
+# Byte budget for stored images
+IMAGE_CACHE_BYTES = int(os.environ.get("FED_IMAGE_CACHE_BYTES", 256 * 1024 * 1024))
+# How long a failed file ID is skipped before it is tried again (seconds)
+IMAGE_MISS_TTL = float(os.environ.get("FED_IMAGE_MISS_TTL", 60 * 60))
+IMAGE_TIMEOUT = 10
+
+# Google Drive URL formats, tried in order
+DRIVE_URL_VARIANTS = [
+    "https://drive.google.com/uc?export=view&id={file_id}",
+    "https://lh3.googleusercontent.com/d/{file_id}",
+    "https://drive.google.com/uc?id={file_id}&export=download",
+    "https://docs.google.com/uc?id={file_id}&export=download"
+]
+# Host to send every variant to instead, e.g. a stand-in server (bench_standin.py) for benchmarks
+DRIVE_BASE_URL = os.environ.get("FED_DRIVE_BASE_URL", "").rstrip("/")
+if DRIVE_BASE_URL:
+    DRIVE_URL_VARIANTS = [DRIVE_BASE_URL + url[url.index("/", len("https://")):] for url in DRIVE_URL_VARIANTS]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (digest TEXT PRIMARY KEY, size INTEGER NOT NULL, last_access REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS images (file_id TEXT PRIMARY KEY, digest TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS variants (file_id TEXT PRIMARY KEY, variant INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS misses (file_id TEXT PRIMARY KEY, failed_at REAL NOT NULL);
+CREATE INDEX IF NOT EXISTS blobs_by_access ON blobs (last_access);
+"""
+
+
+def download_drive_image(file_id, variant, session=None):
+    """Fetch one URL variant for a Drive file. Returns the bytes, or None if it did not look like an image."""
+    url = DRIVE_URL_VARIANTS[variant].format(file_id=file_id)
+    response = (session or requests).get(url, timeout=IMAGE_TIMEOUT)
+    if response.status_code == 200:
+        content_type = response.headers.get('content-type', '').lower()
+        # Check if it's an image and has reasonable size
+        if 'image' in content_type or len(response.content) > 5000:
+            return response.content
+    return None
+
+
+class ImageCache:
+    """Content-addressed image store with LRU eviction and negative caching"""
+
+    def __init__(self, root=IMAGE_CACHE_DIR, max_bytes=IMAGE_CACHE_BYTES, miss_ttl=IMAGE_MISS_TTL):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.miss_ttl = miss_ttl
+        self.blob_dir = os.path.join(root, "blobs")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.db_path = os.path.join(root, "index.sqlite3")
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def get(self, file_id):
+        """Return cached bytes for file_id, or None. Marks the blob as recently used."""
+        with closing(self._connect()) as conn, conn:
+            row = conn.execute("SELECT digest FROM images WHERE file_id = ?", (file_id,)).fetchone()
+            if row is None:
+                return None
+            digest = row[0]
+            conn.execute("UPDATE blobs SET last_access = ? WHERE digest = ?", (time.time(), digest))
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                return f.read()
+        except OSError:
+            # Blob removed by another process's eviction; forget the stale entry
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM images WHERE file_id = ?", (file_id,))
+            return None
+
+    def put(self, file_id, content, variant=None):
+        """Store image bytes for file_id and evict old blobs if the budget is exceeded"""
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Unique per process and thread, so concurrent writers of the same file never share a temp file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO blobs (digest, size, last_access) VALUES (?, ?, ?)",
+                         (digest, len(content), time.time()))
+            conn.execute("INSERT OR REPLACE INTO images (file_id, digest) VALUES (?, ?)", (file_id, digest))
+            conn.execute("DELETE FROM misses WHERE file_id = ?", (file_id,))
+            if variant is not None:
+                conn.execute("INSERT OR REPLACE INTO variants (file_id, variant) VALUES (?, ?)", (file_id, variant))
+        self.evict()
+        return digest
+
+    def evict(self):
+        """Drop least recently used blobs until the cache fits in max_bytes"""
+        with closing(self._connect()) as conn, conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            victims = []
+            for digest, size in conn.execute("SELECT digest, size FROM blobs ORDER BY last_access"):
+                if total <= self.max_bytes:
+                    break
+                victims.append(digest)
+                total -= size
+            conn.executemany("DELETE FROM blobs WHERE digest = ?", [(d,) for d in victims])
+            conn.executemany("DELETE FROM images WHERE digest = ?", [(d,) for d in victims])
+
+        for digest in victims:
+            try:
+                os.remove(self._blob_path(digest))
+            except OSError:
+                pass
+
+    def preferred_variant(self, file_id):
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT variant FROM variants WHERE file_id = ?", (file_id,)).fetchone()
+        return row[0] if row else None
+
+    def is_known_miss(self, file_id):
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT failed_at FROM misses WHERE file_id = ?", (file_id,)).fetchone()
+        return row is not None and time.time() - row[0] < self.miss_ttl
+
+    def record_miss(self, file_id):
+        with closing(self._connect()) as conn, conn:
+            conn.execute("INSERT OR REPLACE INTO misses (file_id, failed_at) VALUES (?, ?)", (file_id, time.time()))
+
+    def fetch(self, file_id, session=None):
+        """Return image bytes for a Drive file ID from the cache, downloading them on a miss"""
+        content = self.get(file_id)
+        if content is not None or self.is_known_miss(file_id):
+            return content
+
+        order = list(range(len(DRIVE_URL_VARIANTS)))
+        preferred = self.preferred_variant(file_id)
+        if preferred in order:
+            order.remove(preferred)
+            order.insert(0, preferred)
+
+        for variant in order:
+            try:
+                content = download_drive_image(file_id, variant, session)
+            except Exception as e:
+                logger.debug("Drive variant %d failed for %s: %s", variant, file_id, e)
+                continue
+            if content:
+                self.put(file_id, content, variant)
+                return content
+
+        self.record_miss(file_id)
+        return None
@@ -0,0 +1,128 @@
+"""Single entry point for loading a parameter sheet.
+
+SheetLoader looks in the shared DataFrameCache first, then the local
+snapshot, and only then downloads the sheet from Google Sheets. Whatever it
+finds is stored in the cache, so every session in the process reuses the
+same DataFrame, and copied into the shared ParameterTensor when one is
+attached.
+
+A failed download is remembered for FED_SHEET_FAILURE_TTL seconds. Reruns
+within that window get the cached error straight away and do not block on
+another request that is likely to time out.
+"""
+import os
+import threading
+import time
+
+from fed_cache import DataFrameCache
+from fed_data import read_sheet
+from fed_percentiles import PercentileModel
+from fed_stats import SummaryIndex
+from fed_tensor import ParameterTensor
+
+# How long a failed sheet download is answered from the failure cache (seconds)
+SHEET_FAILURE_TTL = float(os.environ.get("FED_SHEET_FAILURE_TTL", 5 * 60))
+
+
+class SheetUnavailable(RuntimeError):
+    """A recent download of the sheet failed; raised without contacting the network again"""
+
+
+class SheetLoader:
+    """Layered cache -> snapshot -> network loader for (parameter, gender) sheets"""
+
+    def __init__(self, links_by_gender, snapshot_store=None, cache=None, tensor=None, fetch=read_sheet,
+                 failure_ttl=SHEET_FAILURE_TTL):
+        self.links_by_gender = links_by_gender
+        self.snapshot_store = snapshot_store
+        self.cache = cache if cache is not None else DataFrameCache()
+        self.tensor = tensor
+        self.fetch = fetch
+        self.failure_ttl = failure_ttl
+        # (parameter, gender) -> (failed_at, error message) for recent failed downloads
+        self._failures = {}
+        self._failures_lock = threading.Lock()
+        self._summary = None
+        self._percentiles = None
+        if snapshot_store is not None:
+            # A rebuilt snapshot (startup, background or manual) replaces everything filled from the old one
+            snapshot_store.add_listener(self.reset)
+
+    def has_sheet(self, parameter, gender):
+        return parameter in self.links_by_gender.get(gender, {})
+
+    def recent_failure(self, parameter, gender):
+        """Error message of a download that failed less than failure_ttl seconds ago, else None"""
+        with self._failures_lock:
+            failure = self._failures.get((parameter, gender))
+        if failure is None or time.time() - failure[0] >= self.failure_ttl:
+            return None
+        return failure[1]
+
+    def forget_failures(self, keys=None):
+        """Allow failed sheets (all, or the given (parameter, gender) keys) to be downloaded again"""
+        with self._failures_lock:
+            if keys is None:
+                self._failures.clear()
+            for key in keys or ():
+                self._failures.pop(key, None)
+
+    def load(self, parameter, gender, session=None):
+        """Return the cleaned sheet for parameter and gender.
+
+        Raises if it has to be downloaded and that fails, and raises
+        SheetUnavailable without downloading while a recent failure is cached.
+        """
+        key = (parameter, gender)
+        df = self.cache.get(key)
+        if df is not None:
+            return df
+
+        if self.snapshot_store is not None:
+            df = self.snapshot_store.get(parameter, gender)
+        if df is None:
+            error = self.recent_failure(parameter, gender)
+            if error is not None:
+                raise SheetUnavailable(f"{error} (download failed recently; retrying after a few minutes)")
+            try:
+                df = self.fetch(self.links_by_gender[gender][parameter], session)
+            except Exception as e:
+                with self._failures_lock:
+                    self._failures[key] = (time.time(), str(e))
+                raise
+            self.forget_failures([key])
+        if self.tensor is not None:
+            self.tensor.fill(parameter, gender, df)
+        return self.cache.put(key, df)
+
+    def update(self, frames):
+        """Replace refreshed sheets ({(parameter, gender): df}) in the cache and the tensor"""
+        self.forget_failures(list(frames))
+        for (parameter, gender), df in frames.items():
+            self.cache.discard((parameter, gender))
+            if self.tensor is not None:
+                self.tensor.fill(parameter, gender, df)
+
+    def reset(self):
+        """Drop cached sheets and failures and rebuild the tensor from the current snapshot"""
+        self.cache.clear()
+        self.forget_failures()
+        if self.tensor is not None:
+            snapshot = self.snapshot_store.snapshot if self.snapshot_store is not None else None
+            self.tensor = ParameterTensor.from_snapshot(snapshot, self.tensor.parameters, self.tensor.regions)
+
+    def summary_index(self):
+        """SummaryIndex for the current tensor, rebuilt only after new data has been loaded"""
+        index = self._summary
+        if index is None or index.tensor is not self.tensor or index.version != self.tensor.version:
+            index = self._summary = SummaryIndex(self.tensor)
+        return index
+
+    def percentile_model(self):
+        """PercentileModel over the whole tensor, refitted only after new data has been loaded"""
+        cached = self._percentiles
+        if cached is None or cached[0] is not self.tensor or cached[1] != self.tensor.version:
+            tensor = self.tensor
+            version = tensor.version
+            cached = self._percentiles = (tensor, version, PercentileModel(tensor.values))
+        return cached[2]
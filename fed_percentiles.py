@@ -0,0 +1,114 @@
+"""Arbitrary design percentiles estimated from the stored 5th / Mean / 95th values.
+
+Each (parameter, gender, region) triple is fitted with a normal or a
+log-normal distribution. Both models pass exactly through the stored 5th and
+95th percentiles. They differ in the mean they imply: the normal's mean is
+the midpoint of the two tails, and the log-normal's mean sits towards the
+longer upper tail. With method="auto" each triple uses whichever model
+reproduces its stored mean more closely, so right-skewed measures such as
+skinfolds and strengths come out log-normal and symmetric body dimensions
+come out normal. When only one tail is available, the normal is centred on
+the mean instead.
+
+Fitting and querying work on whole arrays, so the 1st, 10th, 50th and 99th
+percentiles of every parameter, gender and region take a few NumPy
+operations.
+"""
+import math
+from statistics import NormalDist
+
+import numpy as np
+
+Z_95 = NormalDist().inv_cdf(0.95)
+_erfc = np.frompyfunc(math.erfc, 1, 1)
+METHODS = ("auto", "normal", "lognormal")
+
+
+def z_scores(percentiles):
+    """Standard normal quantiles for percentiles given on a 0-100 scale"""
+    percentiles = np.atleast_1d(np.asarray(percentiles, dtype=np.float64))
+    if np.any((percentiles <= 0) | (percentiles >= 100)):
+        raise ValueError("Percentiles must be strictly between 0 and 100")
+    unit = NormalDist()
+    return np.array([unit.inv_cdf(p / 100) for p in percentiles.ravel()]).reshape(percentiles.shape)
+
+
+def normal_cdf(z):
+    """Standard normal CDF of an array, accurate far into both tails"""
+    # frompyfunc gives an object array, or a bare Python float for a scalar
+    return np.asarray(_erfc(-np.asarray(z, dtype=np.float64) / math.sqrt(2)), dtype=np.float64) / 2
+
+
+def fitted_cdf(x, loc, scale, lognormal):
+    """CDF at x of normal fits, or of log-normal fits (loc and scale of log X) where lognormal is True"""
+    x = np.asarray(x, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        t = np.where(lognormal, np.log(np.where(lognormal & (x > 0), x, np.nan)), x)
+        t = np.where(lognormal & (x <= 0), -np.inf, t)
+        return normal_cdf((t - loc) / scale)
+
+
+def percentile_label(percentile):
+    """'1st Percentile', '50th Percentile', '2.5th Percentile'"""
+    text = f"{percentile:g}"
+    if "." not in text and text[-1] in "123" and not text.endswith(("11", "12", "13")):
+        suffix = {"1": "st", "2": "nd", "3": "rd"}[text[-1]]
+    else:
+        suffix = "th"
+    return f"{text}{suffix} Percentile"
+
+
+class PercentileModel:
+    """Normal / log-normal fits for an array whose last axis is (5th percentile, mean, 95th percentile)"""
+
+    def __init__(self, values, method="auto"):
+        if method not in METHODS:
+            raise ValueError(f"method must be one of {', '.join(METHODS)}")
+        values = np.asarray(values, dtype=np.float64)
+        p5, mean, p95 = values[..., 0], values[..., 1], values[..., 2]
+        self.shape = p5.shape
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            loc = (p5 + p95) / 2
+            scale = (p95 - p5) / (2 * Z_95)
+            # One tail missing: centre the normal on the mean and use the tail that is there
+            upper_only = np.isnan(p5) & ~np.isnan(p95)
+            lower_only = np.isnan(p95) & ~np.isnan(p5)
+            loc = np.where(upper_only | lower_only, mean, loc)
+            scale = np.where(upper_only, (p95 - mean) / Z_95, scale)
+            scale = np.where(lower_only, (mean - p5) / Z_95, scale)
+
+            log_ok = (p5 > 0) & (p95 > p5)
+            log_p5 = np.log(np.where(log_ok, p5, np.nan))
+            log_p95 = np.log(np.where(log_ok, p95, np.nan))
+            log_loc = (log_p5 + log_p95) / 2
+            log_scale = (log_p95 - log_p5) / (2 * Z_95)
+
+            if method == "normal":
+                lognormal = np.zeros(self.shape, dtype=bool)
+            elif method == "lognormal":
+                lognormal = log_ok
+            else:
+                log_mean = np.exp(log_loc + log_scale ** 2 / 2)
+                lognormal = log_ok & ~np.isnan(mean) & (np.abs(log_mean - mean) < np.abs(loc - mean))
+
+        scale = np.where(scale > 0, scale, np.nan)
+        self.lognormal = lognormal
+        # Location and scale of the normal, or of log(X) where lognormal is True
+        self.loc = np.where(lognormal, log_loc, loc)
+        self.scale = np.where(lognormal, log_scale, scale)
+
+    def quantiles(self, percentiles):
+        """Estimated values at the given percentiles (0-100), with shape self.shape + (len(percentiles),)"""
+        z = z_scores(percentiles)
+        values = self.loc[..., None] + self.scale[..., None] * z
+        with np.errstate(over="ignore"):
+            return np.where(self.lognormal[..., None], np.exp(values), values)
+
+    def quantile(self, percentile):
+        """Estimated value at one percentile, with shape self.shape"""
+        return self.quantiles([percentile])[..., 0]
+
+    def cdf(self, x):
+        """Fraction of the population below x (0-1); x broadcasts against self.shape"""
+        return fitted_cdf(x, self.loc, self.scale, self.lognormal)
@@ -0,0 +1,193 @@
+"""Pooled statistics for user-defined groups of regions.
+
+A region group such as "North-East" or a dealer territory is treated as a
+weighted mixture of its states. The pooled mean is the weighted mean of the
+state means. The pooled 5th and 95th percentiles are the percentiles of the
+mixture of the states' fitted distributions (see fed_percentiles), found by
+bisection on the mixture CDF. All of this runs for every parameter and
+gender in one pass over the ParameterTensor.
+
+Weights default to equal shares. They can be any non-negative numbers, such
+as census counts of agricultural workers per state, either one set for both
+genders or one set per gender. FED_REGION_WEIGHTS may point to a CSV with
+State and Weight columns (and optionally Gender) to use as the default.
+States without data for a parameter are left out of that parameter's pool
+and the remaining weights are rescaled. A weights table has to cover every
+state in the group; states it leaves out are an error rather than a silent
+zero weight.
+
+Results are cached per group definition and tensor version.
+"""
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from fed_data import GENDERS, STAT_COLUMNS
+from fed_percentiles import fitted_cdf
+
+# CSV of State, Weight[, Gender] used when a group has no weights of its own
+REGION_WEIGHTS = os.environ.get("FED_REGION_WEIGHTS")
+POOL_CACHE_ENTRIES = 64
+BISECTION_STEPS = 48
+
+
+def load_weights(path):
+    """{region: weight}, or {gender: {region: weight}} if the CSV has a Gender column"""
+    df = pd.read_csv(path)
+    df.columns = [str(col).strip().title() for col in df.columns]
+    if 'Gender' in df.columns:
+        return {str(gender).strip().title(): dict(zip(group['State'].str.strip(), group['Weight'].astype(float)))
+                for gender, group in df.groupby('Gender')}
+    return dict(zip(df['State'].str.strip(), df['Weight'].astype(float)))
+
+
+@dataclass(frozen=True, slots=True)
+class RegionGroup:
+    """Named set of regions with optional weights ({region: w} or {gender: {region: w}})"""
+    name: str
+    regions: tuple
+    weights: dict = None
+
+    def key(self):
+        """Hashable form of the group definition, for caching"""
+        weights = self.weights or {}
+        if weights and all(isinstance(value, dict) for value in weights.values()):
+            weights = tuple(sorted((gender, tuple(sorted(values.items()))) for gender, values in weights.items()))
+        else:
+            weights = tuple(sorted(weights.items()))
+        return self.name, tuple(self.regions), weights
+
+    def weight_matrix(self, genders=GENDERS):
+        """(gender, region) array of weights in the order of self.regions.
+
+        Raises ValueError if a weights table leaves out some of the regions.
+        """
+        weights = self.weights or {}
+        per_gender = bool(weights) and all(isinstance(value, dict) for value in weights.values())
+        matrix = np.empty((len(genders), len(self.regions)), dtype=np.float64)
+        for g, gender in enumerate(genders):
+            source = weights.get(gender, {}) if per_gender else weights
+            if not source:
+                matrix[g] = 1.0
+                continue
+            missing = [region for region in self.regions if region not in source]
+            if missing:
+                label = f"{gender} weights" if per_gender else "Weights"
+                raise ValueError(f"{label} for region group {self.name!r} have no entry for: {', '.join(missing)}")
+            matrix[g] = [source[region] for region in self.regions]
+        if np.any(matrix < 0) or np.any(~np.isfinite(matrix)):
+            raise ValueError(f"Weights for region group {self.name!r} must be finite and non-negative")
+        return matrix
+
+
+class PoolingEngine:
+    """Pooled 5th / Mean / 95th for region groups, over one SheetLoader's tensor"""
+
+    def __init__(self, loader, max_entries=POOL_CACHE_ENTRIES):
+        self.loader = loader
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._default_weights = load_weights(REGION_WEIGHTS) if REGION_WEIGHTS else None
+
+    def group(self, name, regions, weights=None):
+        """RegionGroup over regions, using FED_REGION_WEIGHTS when weights is None"""
+        return RegionGroup(name, tuple(regions), weights if weights is not None else self._default_weights)
+
+    def pooled(self, group):
+        """float64 array of shape (parameter, gender, statistic) for the group, NaN where no state has data"""
+        tensor = self.loader.tensor
+        unknown = [region for region in group.regions if region not in tensor.region_index]
+        if unknown:
+            raise KeyError(f"Unknown regions: {', '.join(unknown)}")
+
+        key = (group.key(), id(tensor), tensor.version)
+        with self._lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+                return result
+
+        result = pool_regions(tensor, self.loader.percentile_model(), group.regions,
+                              group.weight_matrix(tensor.genders))
+        result.flags.writeable = False
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return result
+
+    def frame(self, group, parameters=None, genders=None):
+        """Parameter, Gender and the three statistics for the group, one row per parameter and gender"""
+        tensor = self.loader.tensor
+        p, g, _, _ = tensor.indices(parameters, genders)
+        values = self.pooled(group)[np.ix_(p, g)]
+        index = pd.MultiIndex.from_product([[tensor.parameters[i] for i in p], [tensor.genders[i] for i in g]],
+                                           names=['Parameter', 'Gender'])
+        df = pd.DataFrame(values.reshape(-1, len(tensor.stats)), index=index, columns=list(tensor.stats))
+        return df.dropna(how='all').reset_index()
+
+
+def pool_regions(tensor, model, regions, weights):
+    """Pool the given regions of every parameter and gender as a weighted mixture.
+
+    model is the PercentileModel for tensor.values and weights has shape
+    (gender, region). Returns (parameter, gender, statistic) in tensor.stats
+    order.
+    """
+    r = tensor.indices(regions=list(regions))[2]
+    values = tensor.values[:, :, r].astype(np.float64)
+    loc = model.loc[:, :, r]
+    scale = model.scale[:, :, r]
+    lognormal = model.lognormal[:, :, r]
+
+    # Per-parameter weights: states without a fit drop out and the rest are rescaled
+    usable = ~np.isnan(loc) & ~np.isnan(scale)
+    w = np.where(usable, weights[None, :, :], 0.0)
+    total = w.sum(axis=2, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        w = w / total
+
+    result = np.full(values.shape[:2] + (len(tensor.stats),), np.nan)
+    has_pool = total[..., 0] > 0
+
+    s_mean = tensor.stat_index[STAT_COLUMNS[1]]
+    mean_weights = np.where(np.isnan(values[..., s_mean]), 0.0, weights[None, :, :])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result[..., s_mean] = (np.nansum(values[..., s_mean] * mean_weights, axis=2)
+                               / mean_weights.sum(axis=2))
+
+    for stat, q in ((STAT_COLUMNS[0], 0.05), (STAT_COLUMNS[2], 0.95)):
+        quantile = mixture_quantile(loc, scale, lognormal, w, q)
+        result[..., tensor.stat_index[stat]] = np.where(has_pool, quantile, np.nan)
+    return result
+
+
+def mixture_quantile(loc, scale, lognormal, weights, q):
+    """q-quantile (0-1) of weighted normal / log-normal mixtures along the last axis, by bisection.
+
+    Every component's own q-quantile brackets the mixture's, because the
+    mixture CDF is a weighted average of the component CDFs.
+    """
+    usable = weights > 0
+    z = NormalDist().inv_cdf(q)
+    with np.errstate(over="ignore", invalid="ignore"):
+        component = loc + scale * z
+        component = np.where(lognormal, np.exp(component), component)
+    lo = np.min(np.where(usable, component, np.inf), axis=-1)
+    hi = np.max(np.where(usable, component, -np.inf), axis=-1)
+    lo = np.where(np.isfinite(lo), lo, np.nan)
+    hi = np.where(np.isfinite(hi), hi, np.nan)
+
+    for _ in range(BISECTION_STEPS):
+        mid = (lo + hi) / 2
+        cdf = fitted_cdf(mid[..., None], loc, scale, lognormal)
+        below = np.sum(np.where(usable, weights * cdf, 0.0), axis=-1) < q
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return (lo + hi) / 2
@@ -0,0 +1,163 @@
+"""Virtual populations sampled from the stored 5th / Mean / 95th statistics.
+
+Accommodation studies need individuals, not three numbers per state. The
+synthesizer fits each (parameter, gender, region) with the PercentileModel
+and draws correlated individuals through a Gaussian copula. Standard normal
+scores are correlated with the Cholesky factor of the parameter
+correlation matrix, then mapped through each parameter's normal or
+log-normal fit. Every marginal keeps its fitted distribution, and
+parameters such as stature and reach move together the way they do in
+real people.
+
+Sampling is one batched NumPy operation per call, and the same seed always
+gives the same population.
+
+    python fed_population.py -p STATURE "VERTICAL REACH" -n 100000 --corr STATURE "VERTICAL REACH" 0.85 \\
+        -g Male -r Punjab --seed 1 -o punjab.parquet
+"""
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from fed_catalog import CATALOG
+from fed_data import GENDERS
+from fed_percentiles import PercentileModel
+from fed_query import DatasetQuery, default_loader, report_failures
+
+
+def correlation_matrix(parameters, correlations=None, default=0.0):
+    """Correlation matrix over parameters.
+
+    correlations is either a full square matrix or {(parameter, parameter): r}
+    for the pairs that differ from default. Parameter names may be any
+    spelling, alias or ID the catalog knows. Raises ValueError if the matrix
+    is not a valid correlation matrix.
+    """
+    size = len(parameters)
+    if correlations is not None and not isinstance(correlations, dict):
+        matrix = np.array(correlations, dtype=np.float64)
+        if matrix.shape != (size, size):
+            raise ValueError(f"Correlation matrix must be {size} x {size}, got {matrix.shape}")
+    else:
+        matrix = np.full((size, size), float(default))
+        position = {name: i for i, name in enumerate(parameters)}
+
+        def index(name):
+            parameter = CATALOG.resolve(name)
+            i = position.get(parameter.name if parameter is not None else name)
+            if i is None:
+                raise ValueError(f"Correlation given for {name!r}, which is not one of the sampled parameters")
+            return i
+
+        for (a, b), r in (correlations or {}).items():
+            i, j = index(a), index(b)
+            if i == j:
+                raise ValueError(f"Correlation of {a!r} with itself is always 1")
+            matrix[i, j] = matrix[j, i] = r
+        np.fill_diagonal(matrix, 1.0)
+
+    if not np.allclose(matrix, matrix.T) or not np.allclose(np.diag(matrix), 1.0) or np.any(np.abs(matrix) > 1):
+        raise ValueError("Correlation matrix must be symmetric with ones on the diagonal and entries in [-1, 1]")
+    return matrix
+
+
+class PopulationSynthesizer:
+    """Seeded sampler of virtual individuals for a fixed set of parameters"""
+
+    def __init__(self, query, parameters, correlations=None, default_correlation=0.0, method="auto",
+                 errors="warn"):
+        self.parameters, self.genders, self.regions, _ = query.resolve(parameters)
+        # (parameter, gender, region) fits, moved to (gender, region, parameter) for sampling.
+        # Sheets that cannot be loaded are handled as query.array(errors=...) says.
+        model = PercentileModel(query.array(self.parameters, errors=errors), method)
+        self.loc = np.moveaxis(model.loc, 0, -1).astype(np.float32)
+        self.scale = np.moveaxis(model.scale, 0, -1).astype(np.float32)
+        self.lognormal = np.moveaxis(model.lognormal, 0, -1)
+        self.correlation = correlation_matrix(self.parameters, correlations, default_correlation)
+        try:
+            self.cholesky = np.linalg.cholesky(self.correlation).astype(np.float32)
+        except np.linalg.LinAlgError:
+            raise ValueError("Correlation matrix is not positive definite; the pairwise values are inconsistent")
+
+    def sample(self, n, genders=None, regions=None, seed=None):
+        """float32 array of shape (genders, regions, n, parameters).
+
+        Regions without data for a parameter give NaN for that parameter.
+        seed may be an int or a numpy Generator.
+        """
+        g = np.array([self.genders.index(gender) for gender in (genders or self.genders)], dtype=np.intp)
+        r = np.array([self.regions.index(region) for region in (regions or self.regions)], dtype=np.intp)
+        rng = np.random.default_rng(seed)
+
+        values = rng.standard_normal((len(g), len(r), n, len(self.parameters)), dtype=np.float32)
+        values = values @ self.cholesky.T
+        block = np.ix_(g, r)
+        values *= self.scale[block][:, :, None, :]
+        values += self.loc[block][:, :, None, :]
+        lognormal = self.lognormal[block][:, :, None, :]
+        if lognormal.any():
+            np.exp(values, out=values, where=np.broadcast_to(lognormal, values.shape))
+        return values
+
+    def frame(self, n, genders=None, regions=None, seed=None):
+        """Gender, State and one column per parameter, n rows per gender and region that has data"""
+        genders = list(genders or self.genders)
+        regions = list(regions or self.regions)
+        values = self.sample(n, genders, regions, seed)
+        # Skip gender / region blocks with no data for any parameter
+        has_data = ~np.isnan(values[:, :, 0, :]).all(axis=-1)
+        gi, ri = np.nonzero(has_data)
+        rows = values[gi, ri].reshape(-1, len(self.parameters))
+        df = pd.DataFrame(rows, columns=list(self.parameters))
+        df.insert(0, 'State', pd.Categorical(np.repeat([regions[i] for i in ri], n), categories=regions))
+        df.insert(0, 'Gender', pd.Categorical(np.repeat([genders[i] for i in gi], n), categories=genders))
+        return df
+
+    def to_parquet(self, path, n, genders=None, regions=None, seed=None):
+        """Write frame(n, ...) to a Parquet file and return the number of rows"""
+        df = self.frame(n, genders, regions, seed)
+        df.to_parquet(path, index=False)
+        return len(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sample a virtual population from the anthropometric dataset")
+    parser.add_argument("-p", "--parameters", nargs="+", required=True, help="parameter names or IDs")
+    parser.add_argument("-n", "--size", type=int, default=1000, help="individuals per gender and region")
+    parser.add_argument("-g", "--genders", nargs="+", choices=GENDERS, help="default: both")
+    parser.add_argument("-r", "--regions", nargs="+", help="default: all")
+    parser.add_argument("--corr", nargs=3, action="append", default=[], metavar=("A", "B", "R"),
+                        help="correlation between two parameters (repeatable)")
+    parser.add_argument("--default-corr", type=float, default=0.0, help="correlation for unlisted pairs")
+    parser.add_argument("--method", choices=["auto", "normal", "lognormal"], default="auto")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("-o", "--output", help="CSV or Parquet file to write (default: CSV on stdout)")
+    args = parser.parse_args()
+
+    query = DatasetQuery(default_loader())
+    try:
+        correlations = {(a, b): float(r) for a, b, r in args.corr}
+        synthesizer = PopulationSynthesizer(query, args.parameters, correlations, args.default_corr, args.method,
+                                            errors="ignore")
+        _, genders, regions, _ = query.resolve(None, args.genders, args.regions)
+    except (KeyError, ValueError) as e:
+        parser.error(e.args[0])
+
+    start = time.perf_counter()
+    df = synthesizer.frame(args.size, genders, regions, args.seed)
+    elapsed = time.perf_counter() - start
+    print(f"Sampled {len(df):,} individuals x {len(synthesizer.parameters)} parameters in {elapsed:.2f}s",
+          file=sys.stderr)
+
+    if args.output is not None and args.output.endswith(".parquet"):
+        df.to_parquet(args.output, index=False)
+    else:
+        df.to_csv(args.output or sys.stdout, index=False, float_format="%.6g")
+    return report_failures(query.failures)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
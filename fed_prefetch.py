@@ -0,0 +1,65 @@
+"""Concurrent bulk download of parameter sheets.
+
+Sheets are fetched on a bounded thread pool that shares one keep-alive
+requests.Session, so warming the whole catalog takes roughly as long as the
+slowest sheet instead of the sum of all of them.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from fed_data import GENDERS, read_sheet
+
+PREFETCH_WORKERS = int(os.environ.get("FED_PREFETCH_WORKERS", 16))
+
+
+def make_session(pool_size=PREFETCH_WORKERS):
+    """requests.Session whose connection pool is large enough for every worker"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def prefetch_sheets(links_by_gender, max_workers=PREFETCH_WORKERS, progress=None, session=None, fetch=read_sheet):
+    """Fetch every sheet in links_by_gender ({gender: {parameter: url}}) concurrently.
+
+    Returns (frames, failures): frames maps (parameter, gender) to a cleaned
+    DataFrame and failures maps (parameter, gender) to an error message.
+    progress, if given, is called as progress(done, total, key, error) from
+    the calling thread after each sheet finishes.
+    """
+    jobs = [(parameter, gender, url)
+            for gender in GENDERS
+            for parameter, url in links_by_gender.get(gender, {}).items()]
+    frames = {}
+    failures = {}
+    if not jobs:
+        return frames, failures
+
+    own_session = session is None
+    if own_session:
+        session = make_session(max_workers)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)), thread_name_prefix="fed-prefetch") as pool:
+            futures = {pool.submit(fetch, url, session): (parameter, gender) for parameter, gender, url in jobs}
+            for done, future in enumerate(as_completed(futures), start=1):
+                key = futures[future]
+                error = None
+                try:
+                    frames[key] = future.result()
+                except Exception as e:
+                    error = str(e)
+                    failures[key] = error
+                if progress is not None:
+                    progress(done, len(jobs), key, error)
+    finally:
+        if own_session:
+            session.close()
+
+    return frames, failures
+
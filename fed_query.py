@@ -0,0 +1,197 @@
+"""Batch queries across parameters, genders, regions and statistics.
+
+DatasetQuery answers "these parameters x these genders x these regions x
+these statistics" in one call. Sheets that are not in the tensor yet are
+loaded together on a thread pool through the SheetLoader, so they come from
+the shared cache, then the snapshot, then the network. The answer is a
+single slice of the ParameterTensor, returned either as a NumPy array or as
+a tidy DataFrame with one row per value.
+
+Sheets that cannot be loaded leave NaN in the answer. By default that comes
+with a RuntimeWarning; errors="raise" raises SheetLoadError instead and
+errors="ignore" is silent. Either way the failures are kept in
+DatasetQuery.failures, and the command line reports them on stderr and
+exits with status 1.
+
+    python fed_query.py -p "STATURE" "ELBOW HEIGHT" -g Male -s Mean -o seat.csv
+"""
+import argparse
+import sys
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from fed_catalog import CATALOG
+from fed_data import GENDERS, STAT_COLUMNS, read_sheet
+from fed_loader import SheetLoader
+from fed_prefetch import PREFETCH_WORKERS, make_session
+from fed_snapshot import SnapshotStore
+from fed_tensor import ParameterTensor
+
+TIDY_COLUMNS = ['Parameter', 'Gender', 'State', 'Statistic', 'Value']
+ERROR_MODES = ("raise", "warn", "ignore")
+
+
+def describe_failures(failures):
+    """One "Gender/Parameter: error" line per failed sheet"""
+    return [f"{gender}/{parameter}: {error}" for (parameter, gender), error in failures.items()]
+
+
+def report_failures(failures, file=None):
+    """Print failed sheets on stderr (or file); returns the exit status for a command line tool"""
+    for line in describe_failures(failures):
+        print(f"Could not load {line}", file=file or sys.stderr)
+    return 1 if failures else 0
+
+
+class SheetLoadError(RuntimeError):
+    """Some of the sheets a query needs could not be loaded; failures maps (parameter, gender) to the error"""
+
+    def __init__(self, failures):
+        self.failures = dict(failures)
+        super().__init__(f"Could not load {len(self.failures)} sheet(s): " + "; ".join(describe_failures(failures)))
+
+
+def default_loader(snapshot_store=None, fetch=read_sheet):
+    """SheetLoader over the whole catalog and the local snapshot, set up the way the app sets it up"""
+    links = {gender: CATALOG.sheet_links(gender) for gender in GENDERS}
+    snapshot_store = snapshot_store if snapshot_store is not None else SnapshotStore(links)
+    tensor = ParameterTensor.from_snapshot(snapshot_store.snapshot, links["Male"], CATALOG.regions)
+    return SheetLoader(links, snapshot_store=snapshot_store, tensor=tensor, fetch=fetch)
+
+
+class DatasetQuery:
+    """Bulk access to the dataset through a SheetLoader and its ParameterTensor"""
+
+    def __init__(self, loader, max_workers=PREFETCH_WORKERS):
+        if loader.tensor is None:
+            raise ValueError("DatasetQuery needs a SheetLoader with a ParameterTensor")
+        self.loader = loader
+        self.max_workers = max_workers
+        # {(parameter, gender): error} for sheets whose last load through this query failed
+        self.failures = {}
+
+    def resolve(self, parameters=None, genders=None, regions=None, stats=None):
+        """Canonical name lists for a query; None selects everything along that axis.
+
+        Parameter names may be any spelling, alias or ID the catalog knows.
+        Raises KeyError listing every name that cannot be resolved.
+        """
+        tensor = self.loader.tensor
+
+        def axis(names, known, label, canonical=None):
+            if names is None:
+                return list(known)
+            if isinstance(names, str):
+                names = [names]
+            resolved = [canonical(name) if canonical else name for name in names]
+            unknown = [name for name, value in zip(names, resolved) if value not in known]
+            if unknown:
+                raise KeyError(f"Unknown {label}: {', '.join(map(str, unknown))}")
+            return resolved
+
+        def parameter_name(name):
+            parameter = CATALOG.resolve(name)
+            return parameter.name if parameter is not None else name
+
+        return (axis(parameters, tensor.parameters, "parameters", parameter_name),
+                axis(genders, tensor.genders, "genders"),
+                axis(regions, tensor.regions, "regions"),
+                axis(stats, tensor.stats, "statistics"))
+
+    def ensure_loaded(self, parameters, genders):
+        """Load every (parameter, gender) sheet the tensor does not have yet, concurrently.
+
+        Returns {(parameter, gender): error message} for sheets that could not be loaded.
+        """
+        tensor = self.loader.tensor
+        missing = [(parameter, gender) for parameter in parameters for gender in genders
+                   if self.loader.has_sheet(parameter, gender) and not tensor.is_loaded(parameter, gender)]
+        failures = {}
+        if not missing:
+            return failures
+
+        session = make_session(self.max_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing)),
+                                    thread_name_prefix="fed-query") as pool:
+                futures = {key: pool.submit(self.loader.load, *key, session) for key in missing}
+                for key, future in futures.items():
+                    try:
+                        future.result()
+                    except Exception as e:
+                        failures[key] = str(e)
+        finally:
+            session.close()
+        for key in missing:
+            if key in failures:
+                self.failures[key] = failures[key]
+            else:
+                self.failures.pop(key, None)
+        return failures
+
+    def _load(self, parameters, genders, errors):
+        """ensure_loaded, then raise, warn about or ignore the failures according to errors"""
+        if errors not in ERROR_MODES:
+            raise ValueError(f"errors must be one of {', '.join(ERROR_MODES)}, not {errors!r}")
+        failures = self.ensure_loaded(parameters, genders)
+        if failures and errors == "raise":
+            raise SheetLoadError(failures)
+        if failures and errors == "warn":
+            warnings.warn(str(SheetLoadError(failures)), RuntimeWarning, stacklevel=3)
+        return failures
+
+    def array(self, parameters=None, genders=None, regions=None, stats=None, errors="warn"):
+        """float32 array of shape (parameters, genders, regions, statistics) in the order asked for.
+
+        Values that are missing or could not be loaded are NaN. errors says
+        what to do about sheets that could not be loaded: "warn", "raise"
+        (SheetLoadError) or "ignore"; they are recorded in self.failures.
+        """
+        parameters, genders, regions, stats = self.resolve(parameters, genders, regions, stats)
+        self._load(parameters, genders, errors)
+        return self.loader.tensor.select(parameters, genders, regions, stats)
+
+    def frame(self, parameters=None, genders=None, regions=None, stats=None, dropna=True, errors="warn"):
+        """Tidy DataFrame with one Parameter, Gender, State, Statistic, Value row per value.
+
+        errors works as in array().
+        """
+        parameters, genders, regions, stats = self.resolve(parameters, genders, regions, stats)
+        self._load(parameters, genders, errors)
+        values = self.loader.tensor.select(parameters, genders, regions, stats)
+
+        index = pd.MultiIndex.from_product([parameters, genders, regions, stats], names=TIDY_COLUMNS[:4])
+        df = pd.DataFrame({'Value': values.astype(np.float64).ravel()}, index=index).reset_index()
+        if dropna:
+            df = df.dropna(subset=['Value']).reset_index(drop=True)
+        return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the anthropometric dataset in bulk")
+    parser.add_argument("-p", "--parameters", nargs="+", help="parameter names or IDs (default: all)")
+    parser.add_argument("-g", "--genders", nargs="+", choices=GENDERS, help="default: both")
+    parser.add_argument("-r", "--regions", nargs="+", help="default: all")
+    parser.add_argument("-s", "--stats", nargs="+", choices=STAT_COLUMNS, help="default: all")
+    parser.add_argument("-o", "--output", help="CSV or Parquet file to write (default: CSV on stdout)")
+    args = parser.parse_args()
+
+    query = DatasetQuery(default_loader())
+    try:
+        df = query.frame(args.parameters, args.genders, args.regions, args.stats, errors="ignore")
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    if args.output is not None and args.output.endswith(".parquet"):
+        df.to_parquet(args.output, index=False)
+    else:
+        # Values are stored as float32; don't print digits it does not have
+        df.to_csv(args.output or sys.stdout, index=False, float_format="%.6g")
+    return report_failures(query.failures)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""Incremental revalidation of the parameter sheets.
+
+The ETag, Last-Modified date and SHA-256 content hash of every sheet are
+kept in a small JSON file next to the snapshot. A refresh sends conditional
+requests (If-None-Match / If-Modified-Since), so a sheet the server reports
+as unchanged costs a 304 and no body. The CSV export does not always send
+validators, so a full 200 response is also compared by content hash. Only
+sheets whose bytes actually changed are parsed and written back into the
+snapshot, the shared cache and the tensor. Writing a sheet into the tensor
+bumps its version, and the figure and summary caches are keyed on that
+version.
+
+Snapshot builds record validators in the same file. Each refresh starts from
+what is on disk and merges only the entries it checked back into it, so
+neither side overwrites the other's newer validators.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from fed_data import CACHE_DIR, GENDERS, SHEET_TIMEOUT, parse_sheet, sheet_csv_url
+from fed_prefetch import PREFETCH_WORKERS, make_session
+
+logger = logging.getLogger(__name__)
+
+VALIDATORS_PATH = os.path.join(CACHE_DIR, "sheet_validators.json")
+# Seconds between scheduled refreshes; nightly by default
+REFRESH_INTERVAL = float(os.environ.get("FED_REFRESH_INTERVAL", 24 * 60 * 60))
+
+# Serializes read-merge-write cycles on validator files within the process
+_validators_lock = threading.Lock()
+
+# changed maps (parameter, gender) to the re-parsed sheet; unchanged is a list of keys;
+# failures maps keys to error messages; downloaded_bytes counts response bodies received
+RefreshResult = namedtuple("RefreshResult", ["changed", "unchanged", "failures", "downloaded_bytes"])
+
+
+def sheet_key(parameter, gender):
+    """Validator key for one sheet, in the same "Gender/Parameter" form as snapshot failures"""
+    return f"{gender}/{parameter}"
+
+
+def load_validators(path=VALIDATORS_PATH):
+    """Read stored validators, or an empty dict if the file is missing or unreadable"""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning("Ignoring unreadable validator file %s: %s", path, e)
+        return {}
+
+
+def save_validators(validators, path=VALIDATORS_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(validators, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def merge_validators(updates, path=VALIDATORS_PATH):
+    """Write updates over the validators currently on disk, keeping every other entry. Returns the merged dict."""
+    with _validators_lock:
+        validators = load_validators(path)
+        validators.update(updates)
+        save_validators(validators, path)
+    return validators
+
+
+def revalidate_sheet(sheet_url, validator=None, session=None):
+    """Conditionally download one sheet.
+
+    Returns (content, validator, size): content is the new CSV bytes, or None
+    when the sheet is unchanged (a 304, or a 200 with the same content hash),
+    validator is the updated {etag, last_modified, sha256, checked_at} dict
+    and size is the number of body bytes received. Raises on network errors.
+    """
+    validator = validator or {}
+    headers = {}
+    if validator.get("etag"):
+        headers["If-None-Match"] = validator["etag"]
+    if validator.get("last_modified"):
+        headers["If-Modified-Since"] = validator["last_modified"]
+
+    response = (session or requests).get(sheet_csv_url(sheet_url), headers=headers, timeout=SHEET_TIMEOUT)
+    if response.status_code == 304:
+        return None, dict(validator, checked_at=time.time()), 0
+    response.raise_for_status()
+
+    content = response.content
+    updated = {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+        "sha256": hashlib.sha256(content).hexdigest(),
+        "checked_at": time.time(),
+    }
+    if updated["sha256"] == validator.get("sha256"):
+        return None, updated, len(content)
+    return content, updated, len(content)
+
+
+def refresh_sheets(links_by_gender, validators, max_workers=PREFETCH_WORKERS, progress=None, session=None):
+    """Revalidate every sheet in links_by_gender ({gender: {parameter: url}}) concurrently.
+
+    validators is updated in place for every sheet that was checked
+    successfully. progress, if given, is called as
+    progress(done, total, key, error) from the calling thread.
+    """
+    jobs = [(parameter, gender, url)
+            for gender in GENDERS
+            for parameter, url in links_by_gender.get(gender, {}).items()]
+    changed = {}
+    unchanged = []
+    failures = {}
+    downloaded = 0
+    if not jobs:
+        return RefreshResult(changed, unchanged, failures, downloaded)
+
+    def check(parameter, gender, url):
+        content, validator, size = revalidate_sheet(url, validators.get(sheet_key(parameter, gender)), session)
+        # Parse in the worker so a malformed sheet fails here and keeps its old validator
+        return (parse_sheet(content) if content is not None else None), validator, size
+
+    own_session = session is None
+    if own_session:
+        session = make_session(max_workers)
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs)), thread_name_prefix="fed-refresh") as pool:
+            futures = {pool.submit(check, parameter, gender, url): (parameter, gender)
+                       for parameter, gender, url in jobs}
+            for done, future in enumerate(as_completed(futures), start=1):
+                key = futures[future]
+                error = None
+                try:
+                    df, validator, size = future.result()
+                except Exception as e:
+                    error = str(e)
+                    failures[key] = error
+                else:
+                    validators[sheet_key(*key)] = validator
+                    downloaded += size
+                    if df is None:
+                        unchanged.append(key)
+                    else:
+                        changed[key] = df
+                if progress is not None:
+                    progress(done, len(jobs), key, error)
+    finally:
+        if own_session:
+            session.close()
+
+    return RefreshResult(changed, unchanged, failures, downloaded)
+
+
+class SheetRefresher:
+    """Revalidates every sheet on a schedule and pushes only the changed ones to the snapshot and loader"""
+
+    def __init__(self, links_by_gender, snapshot_store=None, loader=None, path=VALIDATORS_PATH,
+                 interval=REFRESH_INTERVAL):
+        self.links_by_gender = links_by_gender
+        self.snapshot_store = snapshot_store
+        self.loader = loader
+        self.path = path
+        self.interval = interval
+        self.validators = load_validators(path)
+        self.last_result = None
+        self.last_error = None
+        self._attempted_at = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._lock.locked()
+
+    @property
+    def last_run(self):
+        """Time of the most recent successful check of any sheet, or None"""
+        checked = [validator.get("checked_at", 0) for validator in self.validators.values()]
+        return max(checked) if checked else None
+
+    def refresh(self, progress=None):
+        """Revalidate all sheets in the calling thread. Returns the RefreshResult, or None if a refresh
+        is already running or it failed."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            self._attempted_at = time.time()
+            start = time.perf_counter()
+            # Start from the file: a snapshot build may have stored newer validators since the last pass
+            validators = {**self.validators, **load_validators(self.path)}
+            before = dict(validators)
+            result = refresh_sheets(self.links_by_gender, validators, progress=progress)
+            if result.changed:
+                if self.snapshot_store is not None:
+                    self.snapshot_store.apply(result.changed)
+                if self.loader is not None:
+                    self.loader.update(result.changed)
+            self.validators = merge_validators({key: validator for key, validator in validators.items()
+                                                if before.get(key) is not validator}, self.path)
+            self.last_result = result
+            self.last_error = None
+            logger.info("Refreshed sheets in %.1fs: %d changed, %d unchanged, %d failed, %d bytes downloaded",
+                        time.perf_counter() - start, len(result.changed), len(result.unchanged),
+                        len(result.failures), result.downloaded_bytes)
+            return result
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning("Sheet refresh failed: %s", e)
+            return None
+        finally:
+            self._lock.release()
+
+    def next_delay(self):
+        """Seconds until the next scheduled refresh, counted from the last check or attempt"""
+        last = max(filter(None, [self.last_run, self._attempted_at]), default=None)
+        if last is None:
+            return self.interval
+        return max(0.0, self.interval - (time.time() - last))
+
+    def start(self):
+        """Run refresh() every interval seconds on a daemon thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        def run():
+            while not self._stop.wait(self.next_delay()):
+                self.refresh()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=run, name="fed-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self):
+        """Short human-readable description of the last refresh"""
+        if self.running:
+            return "checking for changes"
+        result = self.last_result
+        if result is None:
+            return self.last_error or "no incremental refresh yet this session"
+        return (f"{len(result.changed)} changed, {len(result.unchanged)} unchanged, "
+                f"{len(result.failures)} failed ({result.downloaded_bytes / 1024:.0f} KB downloaded)")
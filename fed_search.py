@@ -0,0 +1,212 @@
+"""Inverted-index search over the parameter catalog.
+
+Documents are tokenized once into an inverted index (token -> {document: weight}).
+A query token matches index tokens exactly, by prefix, or within a small edit
+distance that counts swapped letters as one typo, so "verticle" finds
+"vertical" and vice versa. Fuzzy candidates come from a trigram index instead
+of a scan of the vocabulary. Each document must match every query token, and
+results are ranked by the summed, field-weighted match scores.
+"""
+import bisect
+import re
+from collections import defaultdict
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.7
+FUZZY_SCORE = 0.5
+
+
+def tokenize(text):
+    return _TOKEN.findall(str(text).lower())
+
+
+def _trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Edit distance between a and b counting adjacent swaps as one edit, or limit + 1 once it exceeds limit"""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+def max_typos(token):
+    if len(token) <= 3:
+        return 0
+    return 1 if len(token) <= 6 else 2
+
+
+class SearchIndex:
+    """Ranked prefix/fuzzy search over documents made of weighted text fields"""
+
+    def __init__(self, documents):
+        """documents is an iterable of (key, [(text, weight), ...])"""
+        self.keys = []
+        self.postings = defaultdict(dict)
+        for doc_id, (key, fields) in enumerate(documents):
+            self.keys.append(key)
+            for text, weight in fields:
+                for token in tokenize(text):
+                    postings = self.postings[token]
+                    postings[doc_id] = max(postings.get(doc_id, 0.0), weight)
+
+        self.vocabulary = sorted(self.postings)
+        self.trigram_index = defaultdict(set)
+        for token in self.vocabulary:
+            for gram in _trigrams(token):
+                self.trigram_index[gram].add(token)
+        self._expansions = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def expand(self, query_token):
+        """[(index token, score)] for one query token: exact, prefix and fuzzy matches"""
+        cached = self._expansions.get(query_token)
+        if cached is not None:
+            return cached
+
+        matches = {}
+        if query_token in self.postings:
+            matches[query_token] = EXACT_SCORE
+
+        start = bisect.bisect_left(self.vocabulary, query_token)
+        for token in self.vocabulary[start:]:
+            if not token.startswith(query_token):
+                break
+            if token != query_token:
+                # Prefer completions that are close to the typed length
+                matches[token] = PREFIX_SCORE * len(query_token) / len(token) + PREFIX_SCORE / 2
+
+        limit = max_typos(query_token)
+        if limit:
+            candidates = set()
+            for gram in _trigrams(query_token):
+                candidates |= self.trigram_index.get(gram, set())
+            for token in candidates:
+                if token in matches:
+                    continue
+                distance = edit_distance(query_token, token, limit)
+                if distance <= limit:
+                    matches[token] = FUZZY_SCORE / distance
+                elif len(token) > len(query_token) and edit_distance(query_token, token[:len(query_token)], limit) <= limit:
+                    # Typo inside a prefix that is still being typed
+                    matches[token] = FUZZY_SCORE / 2
+
+        result = sorted(matches.items(), key=lambda item: -item[1])
+        if len(self._expansions) < 10000:
+            self._expansions[query_token] = result
+        return result
+
+    def search(self, query, limit=None):
+        """Keys of the documents matching every token of query, best match first"""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return list(self.keys)
+
+        scores = None
+        for query_token in query_tokens:
+            token_scores = {}
+            for token, match_score in self.expand(query_token):
+                for doc_id, weight in self.postings[token].items():
+                    score = match_score * weight
+                    if score > token_scores.get(doc_id, 0.0):
+                        token_scores[doc_id] = score
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {doc_id: scores[doc_id] + score for doc_id, score in token_scores.items() if doc_id in scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [self.keys[doc_id] for doc_id, _ in ranked]
+
+
+def build_parameter_index(application_data, definition_data, design_guide_data):
+    """Index parameter names together with their definitions, design guides and applications"""
+    documents = []
+    for parameter, applications in application_data.items():
+        documents.append((parameter, [
+            (parameter, 3.0),
+            (" ".join(applications), 1.0),
+            (definition_data.get(parameter, ""), 1.0),
+            (design_guide_data.get(parameter, ""), 0.5),
+        ]))
+    return SearchIndex(documents)
+
+
+def build_application_index(applications):
+    """Index application phrases"""
+    return SearchIndex((application, [(application, 1.0)]) for application in applications)
+
+
+def normalize_application(text):
+    """Case- and whitespace-insensitive form of an application phrase"""
+    return " ".join(str(text).split()).lower().rstrip(".")
+
+
+class ApplicationIndex:
+    """Reverse index from application phrase to the parameters that list it"""
+
+    def __init__(self, application_data):
+        self.catalog_order = {parameter: i for i, parameter in enumerate(application_data)}
+        self.labels = {}
+        parameters = defaultdict(list)
+        for parameter, applications in application_data.items():
+            for application in applications:
+                key = normalize_application(application)
+                if not key:
+                    continue
+                # The first phrasing seen is used for display
+                self.labels.setdefault(key, " ".join(str(application).split()))
+                if parameter not in parameters[key]:
+                    parameters[key].append(parameter)
+        self._parameters = {key: tuple(params) for key, params in parameters.items()}
+        self._sets = {key: frozenset(params) for key, params in parameters.items()}
+        self.search_index = build_application_index(self.applications)
+
+    @property
+    def applications(self):
+        """Distinct application phrases, in catalog order"""
+        return list(self.labels.values())
+
+    def parameters_for(self, *applications):
+        """Parameters listed under every one of the given applications, in catalog order"""
+        keys = [normalize_application(application) for application in applications]
+        if not keys:
+            return []
+        if len(keys) == 1:
+            return list(self._parameters.get(keys[0], ()))
+        matched = frozenset.intersection(*(self._sets.get(key, frozenset()) for key in keys))
+        return sorted(matched, key=self.catalog_order.__getitem__)
+
+    def parameters_matching(self, *terms):
+        """Parameters relevant to every search term, where each term may match several application phrases"""
+        matched = None
+        for term in terms:
+            params = set()
+            for label in self.search_index.search(term):
+                params.update(self._sets[normalize_application(label)])
+            matched = params if matched is None else matched & params
+            if not matched:
+                return []
+        return sorted(matched or (), key=self.catalog_order.__getitem__)
@@ -0,0 +1,349 @@
+"""Mergeable quantile sketches built from raw, individual-level survey data.
+
+The sheets only carry 5th / Mean / 95th per state. Raw surveys with one row
+per person are instead streamed through pandas in chunks into one t-digest
+per (parameter, gender, region). A t-digest keeps a bounded number of
+weighted centroids, small near the tails and larger in the middle, so any
+percentile comes out within a fraction of a percentile rank in a few
+kilobytes. It keeps the exact mean, minimum and maximum. Digests merge
+without the raw data, so a region group, "All India" or a second survey is
+a merge of existing sketches.
+
+Raw CSVs are either wide (Gender, State and one column per parameter) or
+long (Gender, State, Parameter, Value). Parameter columns are matched
+through the catalog, so any spelling, alias or ID works.
+
+    python fed_sketch.py ingest survey_2025.csv survey_2026.csv -o sketches.npz
+    python fed_sketch.py query sketches.npz -p STATURE -g Male -r Punjab "Tamil Nadu" -q 1 50 99
+"""
+import argparse
+import json
+import logging
+import math
+import sys
+
+import numpy as np
+import pandas as pd
+
+from fed_catalog import CATALOG, normalize_name
+from fed_data import GENDERS, STAT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COMPRESSION = 200
+CHUNK_ROWS = 100_000
+# Raw values collected before they are folded into the centroids, as a multiple of the compression
+BUFFER_FACTOR = 10
+SKETCH_FORMAT = 1
+
+
+def _compress(means, weights, compression):
+    """Merge sorted-by-mean centroids so that no cluster spans more than one unit of the k1 scale"""
+    order = np.argsort(means, kind="stable")
+    means, weights = means[order], weights[order]
+    cumulative = np.cumsum(weights)
+    midpoint = (cumulative - weights / 2) / cumulative[-1]
+    # k1(q) = compression / (2 pi) * asin(2q - 1): steep at the tails, flat in the middle
+    bucket = np.floor(compression / (2 * math.pi) * np.arcsin(2 * midpoint - 1))
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    merged_weights = np.add.reduceat(weights, starts)
+    merged_means = np.add.reduceat(means * weights, starts) / merged_weights
+    return merged_means, merged_weights
+
+
+class TDigest:
+    """Merging t-digest over float64 values"""
+
+    __slots__ = ("compression", "means", "weights", "min", "max", "sum", "_buffer", "_buffered")
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum = 0.0
+        self._buffer = []
+        self._buffered = 0
+
+    @property
+    def count(self):
+        return float(self.weights.sum()) + self._buffered
+
+    @property
+    def mean(self):
+        count = self.count
+        return self.sum / count if count else math.nan
+
+    def update(self, values):
+        """Add raw values; NaN and infinite values are ignored"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if values.size:
+            self.min = min(self.min, float(values.min()))
+            self.max = max(self.max, float(values.max()))
+            self.sum += float(values.sum())
+            self._buffer.append(values)
+            self._buffered += values.size
+            if self._buffered >= BUFFER_FACTOR * self.compression:
+                self.flush()
+        return self
+
+    def flush(self):
+        """Fold buffered raw values into the centroids"""
+        if self._buffer:
+            means = np.concatenate([self.means, *self._buffer])
+            weights = np.concatenate([self.weights, np.ones(self._buffered)])
+            self._buffer = []
+            self._buffered = 0
+            self.means, self.weights = _compress(means, weights, self.compression)
+        return self
+
+    def merge(self, *others):
+        """New digest holding the values of this digest and others"""
+        result = TDigest(self.compression)
+        digests = [digest.flush() for digest in (self, *others)]
+        means = np.concatenate([digest.means for digest in digests])
+        if means.size:
+            weights = np.concatenate([digest.weights for digest in digests])
+            result.means, result.weights = _compress(means, weights, self.compression)
+        result.min = min(digest.min for digest in digests)
+        result.max = max(digest.max for digest in digests)
+        result.sum = sum(digest.sum for digest in digests)
+        return result
+
+    def _knots(self):
+        """(cumulative weight, value) points to interpolate between, from the minimum to the maximum"""
+        self.flush()
+        cumulative = np.cumsum(self.weights)
+        positions = np.concatenate(([0.0], cumulative - self.weights / 2, [cumulative[-1]]))
+        values = np.concatenate(([self.min], self.means, [self.max]))
+        return positions, values
+
+    def percentiles(self, percentiles):
+        """Estimated values at the given percentiles (0-100); NaN for an empty digest"""
+        percentiles = np.asarray(percentiles, dtype=np.float64)
+        if not self.count:
+            return np.full(percentiles.shape, np.nan)
+        positions, values = self._knots()
+        return np.interp(percentiles / 100 * positions[-1], positions, values)
+
+    def cdf(self, x):
+        """Estimated fraction of values below x (0-1)"""
+        x = np.asarray(x, dtype=np.float64)
+        if not self.count:
+            return np.full(x.shape, np.nan)
+        positions, values = self._knots()
+        return np.interp(x, values, positions) / positions[-1]
+
+
+def _gender(value):
+    """'Male' / 'Female' for the usual spellings (M, male, F, female ...), else None"""
+    text = str(value).strip().lower()
+    if text[:1] == "m":
+        return "Male"
+    if text[:1] in ("f", "w"):
+        return "Female"
+    return None
+
+
+_region_names = {normalize_name(region): region for region in CATALOG.regions}
+
+
+def _region(value):
+    """Catalog spelling of a region name, or the name as written for regions the catalog does not have"""
+    text = " ".join(str(value).split())
+    return _region_names.get(normalize_name(text), text)
+
+
+class SketchSet:
+    """One TDigest per (parameter, gender, region)"""
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        self.compression = compression
+        self.sketches = {}
+        self._skipped = set()
+
+    def add(self, parameter, gender, region, values):
+        key = (parameter, gender, region)
+        sketch = self.sketches.get(key)
+        if sketch is None:
+            sketch = self.sketches[key] = TDigest(self.compression)
+        sketch.update(values)
+
+    def ingest_frame(self, df, gender_column="Gender", region_column="State"):
+        """Add one chunk of raw rows, in wide or long format. Returns the number of values added."""
+        df = df.rename(columns=lambda col: str(col).strip())
+        missing = [col for col in (gender_column, region_column) if col not in df.columns]
+        if missing:
+            raise KeyError(f"Raw data has no column for: {', '.join(missing)}")
+        genders = df[gender_column].map(_gender)
+        regions = df[region_column].map(_region)
+        added = 0
+
+        if {"Parameter", "Value"} <= set(df.columns):
+            parameters = df["Parameter"].map(lambda name: getattr(CATALOG.resolve(name), "name", None))
+            values = pd.to_numeric(df["Value"], errors="coerce")
+            keep = genders.notna() & parameters.notna() & values.notna()
+            for (parameter, gender, region), group in values[keep].groupby(
+                    [parameters[keep], genders[keep], regions[keep]], sort=False):
+                self.add(parameter, gender, region, group.to_numpy())
+                added += len(group)
+            return added
+
+        columns = {}
+        for col in df.columns:
+            if col in (gender_column, region_column):
+                continue
+            parameter = CATALOG.resolve(col)
+            if parameter is None:
+                if col not in self._skipped:
+                    self._skipped.add(col)
+                    logger.info("Skipping column %r: not a catalog parameter", col)
+            else:
+                columns[col] = parameter.name
+        keep = genders.notna()
+        numeric = df.loc[keep, list(columns)].apply(pd.to_numeric, errors="coerce")
+        for (gender, region), group in numeric.groupby([genders[keep], regions[keep]], sort=False):
+            for col, parameter in columns.items():
+                values = group[col].to_numpy(dtype=np.float64)
+                values = values[~np.isnan(values)]
+                if values.size:
+                    self.add(parameter, gender, region, values)
+                    added += values.size
+        return added
+
+    def ingest_csv(self, path, chunksize=CHUNK_ROWS, gender_column="Gender", region_column="State"):
+        """Stream a raw CSV through the sketches chunk by chunk. Returns the number of values added."""
+        added = 0
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            added += self.ingest_frame(chunk, gender_column, region_column)
+        for sketch in self.sketches.values():
+            sketch.flush()
+        return added
+
+    def merge(self, other):
+        """Fold another SketchSet (e.g. a second survey) into this one"""
+        for key, sketch in other.sketches.items():
+            mine = self.sketches.get(key)
+            self.sketches[key] = sketch.merge() if mine is None else mine.merge(sketch)
+        return self
+
+    def regions(self):
+        return sorted({region for _, _, region in self.sketches})
+
+    def sketch(self, parameter, gender, regions=None):
+        """Digest for one parameter and gender, merged over regions (None: all regions)"""
+        name = getattr(CATALOG.resolve(parameter), "name", parameter)
+        wanted = None if regions is None else {_region(region) for region in regions}
+        parts = [sketch for (p, g, region), sketch in self.sketches.items()
+                 if p == name and g == gender and (wanted is None or region in wanted)]
+        if not parts:
+            return TDigest(self.compression)
+        return parts[0].merge(*parts[1:])
+
+    def percentiles(self, parameter, gender, percentiles, regions=None):
+        return self.sketch(parameter, gender, regions).percentiles(percentiles)
+
+    def sheet_frames(self, all_india=True):
+        """{(parameter, gender): State / 5th Percentile / Mean / 95th Percentile DataFrame}.
+
+        These are shaped like cleaned sheets, so SheetLoader.update() can put
+        them into the tensor. With all_india, an "All India" row is computed
+        from every region of the survey merged together, unless the survey
+        already has its own All India rows.
+        """
+        rows = {}
+        for (parameter, gender, region), sketch in self.sketches.items():
+            rows.setdefault((parameter, gender), {})[region] = sketch
+        frames = {}
+        for key, by_region in rows.items():
+            if all_india and "All India" not in by_region:
+                sketches = list(by_region.values())
+                by_region = {"All India": sketches[0].merge(*sketches[1:]), **by_region}
+            records = []
+            for region, sketch in by_region.items():
+                low, high = sketch.percentiles([5, 95])
+                records.append({'State': region, STAT_COLUMNS[0]: low, STAT_COLUMNS[1]: sketch.mean,
+                                STAT_COLUMNS[2]: high})
+            frames[key] = pd.DataFrame(records, columns=['State'] + STAT_COLUMNS)
+        return frames
+
+    def save(self, path):
+        """Write every sketch to one compressed .npz file"""
+        keys = list(self.sketches)
+        sketches = [self.sketches[key].flush() for key in keys]
+        sizes = np.array([len(sketch.means) for sketch in sketches], dtype=np.int64)
+        np.savez_compressed(
+            path,
+            format=np.array(SKETCH_FORMAT),
+            compression=np.array(self.compression),
+            keys=np.array(json.dumps(keys)),
+            offsets=np.concatenate(([0], np.cumsum(sizes))),
+            means=np.concatenate([sketch.means for sketch in sketches]) if sketches else np.empty(0),
+            weights=np.concatenate([sketch.weights for sketch in sketches]) if sketches else np.empty(0),
+            extremes=np.array([[sketch.min, sketch.max, sketch.sum] for sketch in sketches]).reshape(-1, 3),
+        )
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as data:
+            if int(data["format"]) != SKETCH_FORMAT:
+                raise ValueError(f"Unsupported sketch format {int(data['format'])} in {path}")
+            result = cls(int(data["compression"]))
+            offsets, means, weights, extremes = data["offsets"], data["means"], data["weights"], data["extremes"]
+            for i, key in enumerate(json.loads(str(data["keys"]))):
+                sketch = TDigest(result.compression)
+                sketch.means = means[offsets[i]:offsets[i + 1]]
+                sketch.weights = weights[offsets[i]:offsets[i + 1]]
+                sketch.min, sketch.max, sketch.sum = (float(value) for value in extremes[i])
+                result.sketches[tuple(key)] = sketch
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantile sketches from raw survey data")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("ingest", help="stream raw CSVs into a sketch file")
+    ingest.add_argument("csv", nargs="+")
+    ingest.add_argument("-o", "--output", required=True, help=".npz sketch file to write")
+    ingest.add_argument("--into", help="existing sketch file to merge the new data into")
+    ingest.add_argument("--compression", type=int, default=DEFAULT_COMPRESSION)
+    ingest.add_argument("--gender-column", default="Gender")
+    ingest.add_argument("--region-column", default="State")
+    ingest.add_argument("--chunksize", type=int, default=CHUNK_ROWS)
+    query = commands.add_parser("query", help="percentiles from a sketch file")
+    query.add_argument("sketches")
+    query.add_argument("-p", "--parameters", nargs="+", required=True)
+    query.add_argument("-g", "--genders", nargs="+", choices=GENDERS, default=list(GENDERS))
+    query.add_argument("-r", "--regions", nargs="+", help="regions to merge (default: all)")
+    query.add_argument("-q", "--percentiles", nargs="+", type=float, default=[5, 50, 95])
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    if args.command == "ingest":
+        sketches = SketchSet.load(args.into) if args.into else SketchSet(args.compression)
+        for path in args.csv:
+            try:
+                added = sketches.ingest_csv(path, args.chunksize, args.gender_column, args.region_column)
+            except KeyError as e:
+                parser.error(f"{path}: {e.args[0]}")
+            print(f"{path}: {added:,} values", file=sys.stderr)
+        sketches.save(args.output)
+        print(f"{len(sketches.sketches)} sketches written to {args.output}", file=sys.stderr)
+        return 0
+
+    sketches = SketchSet.load(args.sketches)
+    rows = []
+    for parameter in args.parameters:
+        for gender in args.genders:
+            sketch = sketches.sketch(parameter, gender, args.regions)
+            row = {'Parameter': parameter, 'Gender': gender, 'Count': int(sketch.count), 'Mean': sketch.mean}
+            row.update(zip((f"P{q:g}" for q in args.percentiles), sketch.percentiles(args.percentiles)))
+            rows.append(row)
+    pd.DataFrame(rows).to_csv(sys.stdout, index=False, float_format="%.6g")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
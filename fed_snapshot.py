@@ -0,0 +1,234 @@
+"""On-disk snapshot of every parameter sheet.
+
+All male and female sheets are pulled once and stacked into a single
+uncompressed Feather (Arrow IPC) file, sorted by gender and parameter. The
+file is opened memory-mapped and an offset index maps each
+(parameter, gender) pair to its block of rows, so serving a sheet is a slice
+rather than a network round trip.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from fed_data import CACHE_DIR, GENDERS, STAT_COLUMNS, parse_sheet, read_sheet
+from fed_prefetch import prefetch_sheets
+from fed_refresh import VALIDATORS_PATH, merge_validators, revalidate_sheet, sheet_key
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, "sheets_snapshot.feather")
+# Rebuild the snapshot in the background once it is older than this (seconds)
+SNAPSHOT_MAX_AGE = float(os.environ.get("FED_SNAPSHOT_MAX_AGE", 24 * 60 * 60))
+
+KEY_COLUMNS = ['Parameter', 'Gender']
+SHEET_COLUMNS = ['State'] + STAT_COLUMNS
+
+
+class SheetSnapshot:
+    """Read-only, memory-mapped view over a snapshot file"""
+
+    def __init__(self, table):
+        self.table = table
+        metadata = table.schema.metadata or {}
+        self.built_at = float(metadata.get(b"fed_built_at", b"0"))
+        self.failures = json.loads(metadata.get(b"fed_failures", b"{}"))
+        self._offsets = {}
+
+        parameters = table.column('Parameter').to_pylist()
+        genders = table.column('Gender').to_pylist()
+        start = 0
+        for i in range(1, len(parameters) + 1):
+            if i == len(parameters) or (parameters[i], genders[i]) != (parameters[start], genders[start]):
+                self._offsets[(parameters[start], genders[start])] = (start, i - start)
+                start = i
+
+    def __contains__(self, key):
+        return key in self._offsets
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def keys(self):
+        return self._offsets.keys()
+
+    def age(self):
+        return time.time() - self.built_at
+
+    def get(self, parameter, gender):
+        """Return the cleaned sheet for one parameter and gender, or None if it is not in the snapshot"""
+        location = self._offsets.get((parameter, gender))
+        if location is None:
+            return None
+        df = self.table.slice(*location).to_pandas()
+        df = df.drop(columns=KEY_COLUMNS)
+        # State and the stat columns are always there, even if all NaN; other sheets' extra columns are dropped
+        extra = [col for col in df.columns if col not in SHEET_COLUMNS and df[col].notna().any()]
+        return df.reindex(columns=SHEET_COLUMNS + extra).reset_index(drop=True)
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """Open a snapshot file memory-mapped. Returns None if it is missing or unreadable."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return SheetSnapshot(feather.read_table(path, memory_map=True))
+    except Exception as e:
+        logger.warning("Ignoring unreadable snapshot %s: %s", path, e)
+        return None
+
+
+def write_snapshot(frames, path=SNAPSHOT_PATH, failures=None):
+    """Stack cleaned sheets keyed by (parameter, gender) into one Feather file"""
+    blocks = []
+    for (parameter, gender), df in frames.items():
+        if df is None or df.empty:
+            continue
+        block = df.copy()
+        # Sheet-specific extra columns are kept as text so every block shares one schema
+        for col in block.columns:
+            if col not in STAT_COLUMNS:
+                block[col] = block[col].astype("string")
+        block.insert(0, 'Gender', gender)
+        block.insert(0, 'Parameter', parameter)
+        blocks.append(block)
+
+    if not blocks:
+        raise ValueError("No sheet data to write")
+
+    stacked = pd.concat(blocks, ignore_index=True)
+    stacked = stacked.sort_values(KEY_COLUMNS, kind='stable').reset_index(drop=True)
+    table = pa.Table.from_pandas(stacked, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[b"fed_built_at"] = str(time.time()).encode()
+    metadata[b"fed_failures"] = json.dumps(failures or {}).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+    return load_snapshot(path)
+
+
+def build_snapshot(links_by_gender, path=SNAPSHOT_PATH, progress=None, fetch=read_sheet, previous=None,
+                   validators_path=VALIDATORS_PATH):
+    """Download every sheet in links_by_gender ({gender: {parameter: url}}) and write a snapshot.
+
+    Sheets that fail to download keep their frames from previous, the
+    snapshot being replaced, so a flaky refresh never loses data. The
+    failures are still recorded in the snapshot for reporting. When sheets
+    come from the network, the ETag, Last-Modified and content hash of each
+    response are stored in validators_path, so the next incremental refresh
+    sends conditional requests instead of downloading everything again.
+    """
+    validators = {}
+    if fetch is read_sheet:
+        keys_by_url = {}
+        for gender in GENDERS:
+            for parameter, url in links_by_gender.get(gender, {}).items():
+                keys_by_url.setdefault(url, []).append(sheet_key(parameter, gender))
+
+        def fetch(url, session=None):
+            content, validator, _ = revalidate_sheet(url, None, session)
+            df = parse_sheet(content)
+            for key in keys_by_url[url]:
+                validators[key] = validator
+            return df
+
+    start = time.perf_counter()
+    frames, failures = prefetch_sheets(links_by_gender, progress=progress, fetch=fetch)
+    logger.info("Fetched %d sheets in %.1fs", len(frames), time.perf_counter() - start)
+
+    if failures:
+        logger.warning("Snapshot build: %d of %d sheets failed", len(failures), len(frames) + len(failures))
+        if previous is not None:
+            carried = {key: previous.get(*key) for key in failures if key in previous}
+            frames.update(carried)
+            if carried:
+                logger.info("Snapshot build: kept the previous data for %d failed sheets", len(carried))
+    failures = {f"{gender}/{parameter}": error for (parameter, gender), error in failures.items()}
+    snapshot = write_snapshot(frames, path, failures)
+    if validators and validators_path is not None:
+        # Failed sheets keep whatever validators they had, matching the frames carried over above
+        merge_validators(validators, validators_path)
+    return snapshot
+
+
+class SnapshotStore:
+    """Process-wide handle on the current snapshot, rebuilt in a background thread when missing or stale"""
+
+    def __init__(self, links_by_gender, path=SNAPSHOT_PATH, max_age=SNAPSHOT_MAX_AGE, validators_path=VALIDATORS_PATH):
+        self.links_by_gender = links_by_gender
+        self.path = path
+        self.validators_path = validators_path
+        self.max_age = max_age
+        self.snapshot = load_snapshot(path)
+        self.last_error = None
+        self._build_lock = threading.Lock()
+        self._listeners = []
+
+    @property
+    def building(self):
+        return self._build_lock.locked()
+
+    def get(self, parameter, gender):
+        snapshot = self.snapshot
+        if snapshot is None:
+            return None
+        return snapshot.get(parameter, gender)
+
+    def is_stale(self):
+        return self.snapshot is None or self.snapshot.age() > self.max_age
+
+    def status(self):
+        """Short human-readable description of the snapshot state"""
+        if self.snapshot is None:
+            return "building" if self.building else "not available"
+        built = datetime.fromtimestamp(self.snapshot.built_at, tz=timezone.utc)
+        return f"{len(self.snapshot)} sheets, built {built:%Y-%m-%d %H:%M} UTC"
+
+    def add_listener(self, callback):
+        """Call callback() after every successful rebuild, from the thread that ran it"""
+        self._listeners.append(callback)
+
+    def rebuild(self, progress=None):
+        """Rebuild the snapshot in the calling thread and notify the listeners.
+        Returns False if a build is already running or it failed."""
+        if not self._build_lock.acquire(blocking=False):
+            return False
+        try:
+            self.snapshot = build_snapshot(self.links_by_gender, self.path, progress=progress, previous=self.snapshot,
+                                           validators_path=self.validators_path)
+            self.last_error = None
+        except Exception as e:
+            self.last_error = str(e)
+            logger.warning("Snapshot build failed: %s", e)
+            return False
+        finally:
+            self._build_lock.release()
+        for callback in list(self._listeners):
+            callback()
+        return True
+
+    def apply(self, frames):
+        """Write refreshed sheets ({(parameter, gender): df}) into the snapshot, keeping every other sheet"""
+        with self._build_lock:
+            snapshot = self.snapshot
+            merged = {key: snapshot.get(*key) for key in snapshot.keys()} if snapshot is not None else {}
+            merged.update(frames)
+            failures = {sheet: error for sheet, error in (snapshot.failures if snapshot is not None else {}).items()
+                        if tuple(reversed(sheet.split("/", 1))) not in frames}
+            self.snapshot = write_snapshot(merged, self.path, failures)
+            return self.snapshot
+
+    def refresh_if_stale(self):
+        """Start a background rebuild when the snapshot is missing or older than max_age"""
+        if self.is_stale() and not self.building:
+            threading.Thread(target=self.rebuild, name="fed-snapshot-build", daemon=True).start()
@@ -0,0 +1,63 @@
+"""Precomputed summary statistics over the ParameterTensor.
+
+SummaryIndex reduces the whole (parameter, gender, region, statistic) array
+in a handful of NumPy calls: the mean across states of each statistic, the
+lowest and highest state, the spread between them, how many states have a
+value, and the male-minus-female difference of the means. It is rebuilt only
+when the tensor's version changes, so Streamlit reruns just look values up.
+"""
+import warnings
+
+import numpy as np
+
+
+class SummaryIndex:
+    """Per-parameter, per-gender aggregates and gender deltas for one tensor version"""
+
+    def __init__(self, tensor):
+        self.tensor = tensor
+        self.version = tensor.version
+        values = tensor.values.astype(np.float64)
+        has_value = ~np.isnan(values)
+
+        with warnings.catch_warnings():
+            # All-NaN slices (sheets not loaded yet) legitimately produce NaN here
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            self.mean = np.nanmean(values, axis=2)
+            self.min = np.nanmin(values, axis=2)
+            self.max = np.nanmax(values, axis=2)
+
+        self.count = has_value.sum(axis=2)
+        self.spread = self.max - self.min
+        self.min_region = np.where(has_value, values, np.inf).argmin(axis=2)
+        self.max_region = np.where(has_value, values, -np.inf).argmax(axis=2)
+
+        male = tensor.gender_index.get("Male")
+        female = tensor.gender_index.get("Female")
+        if male is not None and female is not None:
+            self.gender_delta = self.mean[:, male] - self.mean[:, female]
+        else:
+            self.gender_delta = np.full((len(tensor.parameters), len(tensor.stats)), np.nan)
+
+    def summary(self, parameter, gender):
+        """{statistic: {mean, min, max, spread, count, min_state, max_state}} for one parameter and gender"""
+        p = self.tensor.param_index[parameter]
+        g = self.tensor.gender_index[gender]
+        result = {}
+        for s, stat in enumerate(self.tensor.stats):
+            count = int(self.count[p, g, s])
+            result[stat] = {
+                'mean': float(self.mean[p, g, s]),
+                'min': float(self.min[p, g, s]),
+                'max': float(self.max[p, g, s]),
+                'spread': float(self.spread[p, g, s]),
+                'count': count,
+                'min_state': self.tensor.regions[self.min_region[p, g, s]] if count else None,
+                'max_state': self.tensor.regions[self.max_region[p, g, s]] if count else None,
+            }
+        return result
+
+    def delta(self, parameter):
+        """{statistic: male mean - female mean} for one parameter"""
+        p = self.tensor.param_index[parameter]
+        return {stat: float(self.gender_delta[p, s]) for s, stat in enumerate(self.tensor.stats)}
@@ -0,0 +1,139 @@
+"""Dense parameter x gender x region x statistic array for analytics.
+
+The whole dataset fits in one float32 array of shape
+(parameters, 2 genders, regions, 3 statistics), with NaN where a sheet has no
+value. Integer index maps translate names to positions, so filtering by
+region, averaging over states or comparing genders are array slices instead
+of repeated DataFrame filtering, and cross-parameter queries need no
+per-parameter DataFrames at all.
+"""
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+from fed_data import GENDERS, STAT_COLUMNS
+
+# Versions are unique across every tensor in the process, so a rebuilt tensor never reuses a cache key
+_versions = itertools.count(1)
+
+
+class ParameterTensor:
+    """float32 array of shape (parameter, gender, region, statistic) plus name -> index maps"""
+
+    def __init__(self, parameters, regions, genders=GENDERS, stats=STAT_COLUMNS):
+        self.parameters = tuple(parameters)
+        self.genders = tuple(genders)
+        self.regions = tuple(regions)
+        self.stats = tuple(stats)
+        self.param_index = {name: i for i, name in enumerate(self.parameters)}
+        self.gender_index = {name: i for i, name in enumerate(self.genders)}
+        self.region_index = {name: i for i, name in enumerate(self.regions)}
+        self.stat_index = {name: i for i, name in enumerate(self.stats)}
+
+        self.values = np.full(
+            (len(self.parameters), len(self.genders), len(self.regions), len(self.stats)),
+            np.nan, dtype=np.float32
+        )
+        # Which (parameter, gender) sheets have been filled in, and at which version
+        self.loaded = np.zeros((len(self.parameters), len(self.genders)), dtype=bool)
+        self.sheet_versions = np.zeros((len(self.parameters), len(self.genders)), dtype=np.int64)
+        self.version = next(_versions)
+        self._lock = threading.Lock()
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def is_loaded(self, parameter, gender):
+        p = self.param_index.get(parameter)
+        return p is not None and bool(self.loaded[p, self.gender_index[gender]])
+
+    def sheet_version(self, parameter, gender):
+        """Tensor version at which this sheet was last filled, for keying derived caches"""
+        p = self.param_index.get(parameter)
+        return int(self.sheet_versions[p, self.gender_index[gender]]) if p is not None else -1
+
+    def _region_positions(self, states):
+        return pd.Index(self.regions).get_indexer(pd.Series(states, dtype=object).astype(str).str.strip())
+
+    def fill(self, parameter, gender, df):
+        """Copy one cleaned sheet (State + statistic columns) into the array"""
+        p = self.param_index.get(parameter)
+        if p is None or 'State' not in df.columns:
+            return False
+        g = self.gender_index[gender]
+        positions = self._region_positions(df['State'])
+        known = positions >= 0
+        block = np.full((len(self.regions), len(self.stats)), np.nan, dtype=np.float32)
+        for s, stat in enumerate(self.stats):
+            if stat in df.columns:
+                block[positions[known], s] = pd.to_numeric(df[stat], errors='coerce').to_numpy(dtype=np.float32)[known]
+        with self._lock:
+            self.version = next(_versions)
+            self.values[p, g] = block
+            self.loaded[p, g] = True
+            self.sheet_versions[p, g] = self.version
+        return True
+
+    def fill_long(self, df):
+        """Copy a long table with Parameter, Gender, State and statistic columns into the array in one pass"""
+        p = pd.Index(self.parameters).get_indexer(df['Parameter'])
+        g = pd.Index(self.genders).get_indexer(df['Gender'])
+        r = self._region_positions(df['State'])
+        known = (p >= 0) & (g >= 0) & (r >= 0)
+        p, g, r = p[known], g[known], r[known]
+        with self._lock:
+            self.version = next(_versions)
+            for s, stat in enumerate(self.stats):
+                if stat in df.columns:
+                    self.values[p, g, r, s] = pd.to_numeric(df[stat], errors='coerce').to_numpy(dtype=np.float32)[known]
+            self.loaded[p, g] = True
+            self.sheet_versions[p, g] = self.version
+
+    def indices(self, parameters=None, genders=None, regions=None, stats=None):
+        """Translate name lists into index arrays; None selects everything along that axis"""
+        def lookup(names, index, size):
+            if names is None:
+                return np.arange(size)
+            if isinstance(names, str):
+                names = [names]
+            return np.array([index[name] for name in names if name in index], dtype=np.intp)
+
+        return (lookup(parameters, self.param_index, len(self.parameters)),
+                lookup(genders, self.gender_index, len(self.genders)),
+                lookup(regions, self.region_index, len(self.regions)),
+                lookup(stats, self.stat_index, len(self.stats)))
+
+    def select(self, parameters=None, genders=None, regions=None, stats=None):
+        """Sub-array for any combination of parameters, genders, regions and statistics"""
+        return self.values[np.ix_(*self.indices(parameters, genders, regions, stats))]
+
+    def sheet(self, parameter, gender, regions=None):
+        """(region, statistic) block for one parameter and gender"""
+        p = self.param_index[parameter]
+        g = self.gender_index[gender]
+        if not regions:
+            return self.values[p, g]
+        return self.values[p, g, self.indices(regions=regions)[2]]
+
+    def frame(self, parameter, gender, regions=None):
+        """State + statistic DataFrame for the selected regions in catalog order, skipping regions with no data"""
+        r = np.sort(self.indices(regions=regions or None)[2])
+        block = self.values[self.param_index[parameter], self.gender_index[gender], r]
+        has_values = ~np.isnan(block).all(axis=1)
+        df = pd.DataFrame(block[has_values].astype(np.float64), columns=list(self.stats))
+        df.insert(0, 'State', [self.regions[i] for i in r[has_values]])
+        return df
+
+    @classmethod
+    def from_snapshot(cls, snapshot, parameters, regions):
+        """Build the array straight from a SheetSnapshot's Arrow table"""
+        tensor = cls(parameters, regions)
+        if snapshot is not None and len(snapshot):
+            names = snapshot.table.column_names
+            columns = ['Parameter', 'Gender', 'State'] + [stat for stat in STAT_COLUMNS if stat in names]
+            if 'State' in names:
+                tensor.fill_long(snapshot.table.select(columns).to_pandas())
+        return tensor
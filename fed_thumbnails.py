@@ -0,0 +1,127 @@
+"""Pre-sized thumbnails of the parameter illustrations.
+
+Originals come from the shared ImageCache and are downscaled once per
+(file ID, width) into a compact format (WebP by default, AVIF on request),
+then served from disk. The Quick Stats panel uses the small variant and the
+comparison view the large one, so browsers never download or decode the
+full-resolution Drive image.
+
+A read-only cache (an offline bundle's thumbnails) only serves the files it
+already has and falls back to the original image; it never writes.
+"""
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image, ImageOps, features
+
+from fed_data import CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = os.path.join(CACHE_DIR, "thumbnails")
+QUICK_STATS_WIDTH = 200
+COMPARISON_WIDTH = 600
+THUMBNAIL_WIDTHS = (QUICK_STATS_WIDTH, COMPARISON_WIDTH)
+THUMBNAIL_QUALITY = 80
+
+# (Pillow format, file extension), best first
+_FORMATS = {
+    "avif": ("AVIF", "avif"),
+    "webp": ("WEBP", "webp"),
+    "jpeg": ("JPEG", "jpg"),
+}
+
+
+def pick_format(preferred=None):
+    """Return the (Pillow format, extension) to encode thumbnails with"""
+    preferred = (preferred or os.environ.get("FED_THUMBNAIL_FORMAT", "webp")).lower()
+    if preferred in ("avif", "webp") and features.check(preferred):
+        return _FORMATS[preferred]
+    if preferred == "jpeg":
+        return _FORMATS["jpeg"]
+    if features.check("webp"):
+        return _FORMATS["webp"]
+    return _FORMATS["jpeg"]
+
+
+def make_thumbnail(content, width, image_format="WEBP"):
+    """Downscale encoded image bytes to at most `width` pixels wide and re-encode them"""
+    with Image.open(io.BytesIO(content)) as image:
+        image = ImageOps.exif_transpose(image)
+        if image_format == "JPEG":
+            image = image.convert("RGB")
+        elif image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, format=image_format, quality=THUMBNAIL_QUALITY)
+    return out.getvalue()
+
+
+class ThumbnailCache:
+    """Generate-once store of downscaled images, backed by an ImageCache for the originals"""
+
+    def __init__(self, image_cache, root=THUMBNAIL_DIR, image_format=None, read_only=False):
+        self.image_cache = image_cache
+        self.root = root
+        self.read_only = read_only
+        if read_only:
+            # Serve the stored files as they are, even if this Pillow build cannot encode their format
+            self.image_format, self.extension = _FORMATS[image_format.lower()]
+        else:
+            self.image_format, self.extension = pick_format(image_format)
+            os.makedirs(root, exist_ok=True)
+
+    def _path(self, file_id, width):
+        return os.path.join(self.root, f"{file_id}_{width}.{self.extension}")
+
+    def peek(self, file_id, width):
+        """Return thumbnail bytes only if they have already been generated"""
+        try:
+            with open(self._path(file_id, width), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def get(self, file_id, width):
+        """Return thumbnail bytes for a Drive file ID, or None if the original is unavailable.
+
+        A read-only cache returns the original image bytes when it has no thumbnail.
+        """
+        thumbnail = self.peek(file_id, width)
+        if thumbnail is not None:
+            return thumbnail
+        if self.read_only:
+            return self.image_cache.fetch(file_id)
+
+        path = self._path(file_id, width)
+        original = self.image_cache.fetch(file_id)
+        if original is None:
+            return None
+        try:
+            thumbnail = make_thumbnail(original, width, self.image_format)
+        except Exception as e:
+            logger.warning("Could not make a %dpx thumbnail for %s: %s", width, file_id, e)
+            return None
+
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(thumbnail)
+        os.replace(tmp_path, path)
+        return thumbnail
+
+    def build_all(self, image_links_by_gender, widths=THUMBNAIL_WIDTHS, max_workers=8):
+        """Generate every thumbnail for {gender: {parameter: file_id}}. Returns the file IDs that failed."""
+        file_ids = sorted({file_id for links in image_links_by_gender.values() for file_id in links.values()})
+
+        def build(file_id):
+            return all([self.get(file_id, width) is not None for width in widths])
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fed-thumbs") as pool:
+            results = pool.map(build, file_ids)
+        return [file_id for file_id, ok in zip(file_ids, results) if not ok]
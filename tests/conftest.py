@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The fed_* modules live at the repository root, next to FED_CODE.py
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+import pytest
+
+from fed_percentiles import PercentileModel, Z_95, normal_cdf, percentile_label, z_scores
+
+PERCENTILES = [1, 5, 10, 50, 90, 95, 99]
+
+
+def test_normal_cdf_matches_inverse_and_tails():
+    z = z_scores(PERCENTILES)
+    np.testing.assert_allclose(normal_cdf(z) * 100, PERCENTILES, rtol=1e-12)
+    assert normal_cdf(0.0) == 0.5
+    # erfc keeps relative accuracy where 1 - cdf(z) would underflow to 0
+    assert normal_cdf(-10.0) == pytest.approx(7.619853024160527e-24, rel=1e-12)
+    assert np.isnan(normal_cdf(np.nan))
+    assert normal_cdf([[-1.0, 1.0]]).shape == (1, 2)
+
+
+def test_z_scores_reject_out_of_range_percentiles():
+    for bad in ([0], [100], [-5, 50], [50, 120]):
+        with pytest.raises(ValueError):
+            z_scores(bad)
+
+
+def test_normal_round_trip():
+    model = PercentileModel([1550.0, 1660.0, 1770.0], method="normal")
+    assert not model.lognormal
+    assert model.loc == pytest.approx(1660.0)
+    assert model.scale == pytest.approx(110.0 / Z_95)
+    values = model.quantiles(PERCENTILES)
+    assert values[1] == pytest.approx(1550.0) and values[5] == pytest.approx(1770.0)
+    np.testing.assert_allclose(model.cdf(values) * 100, PERCENTILES, rtol=1e-9)
+
+
+def test_log_normal_round_trip():
+    model = PercentileModel([5.0, 12.0, 30.0], method="auto")
+    assert model.lognormal
+    values = model.quantiles(PERCENTILES)
+    assert values[1] == pytest.approx(5.0) and values[5] == pytest.approx(30.0)
+    assert values[3] == pytest.approx(math.sqrt(5.0 * 30.0))
+    np.testing.assert_allclose(model.cdf(values) * 100, PERCENTILES, rtol=1e-9)
+    assert model.cdf(0.0) == 0.0 and model.cdf(-1.0) == 0.0
+
+
+def test_auto_picks_the_model_closer_to_the_stored_mean():
+    model = PercentileModel([[1550.0, 1660.0, 1770.0], [5.0, 12.0, 30.0]])
+    assert model.lognormal.tolist() == [False, True]
+    assert not PercentileModel([5.0, 12.0, 30.0], method="normal").lognormal
+
+
+def test_one_tail_centres_the_normal_on_the_mean():
+    model = PercentileModel([[np.nan, 1660.0, 1770.0], [1550.0, 1660.0, np.nan]])
+    np.testing.assert_allclose(model.loc, [1660.0, 1660.0])
+    np.testing.assert_allclose(model.scale, [110.0 / Z_95, 110.0 / Z_95])
+    np.testing.assert_allclose(model.quantile(95)[0], 1770.0)
+    np.testing.assert_allclose(model.quantile(5)[1], 1550.0)
+
+
+@pytest.mark.parametrize("values", [
+    [1770.0, 1660.0, 1550.0],   # tails swapped: negative spread
+    [1660.0, 1660.0, 1660.0],   # zero spread
+    [np.nan, 1660.0, np.nan],   # mean only
+    [np.nan, np.nan, np.nan],
+    [np.nan, np.nan, 1770.0],   # tail without a mean
+])
+def test_invalid_spread_gives_nan_not_an_estimate(values):
+    model = PercentileModel(values)
+    assert np.isnan(model.scale)
+    assert not model.lognormal
+    assert np.isnan(model.quantiles(PERCENTILES)).all()
+    assert np.isnan(model.cdf(1660.0))
+
+
+def test_invalid_rows_do_not_affect_valid_ones():
+    model = PercentileModel([[1550.0, 1660.0, 1770.0], [1770.0, 1660.0, 1550.0], [np.nan] * 3])
+    estimates = model.quantile(50)
+    assert estimates[0] == pytest.approx(1660.0)
+    assert np.isnan(estimates[1:]).all()
+
+
+def test_non_positive_values_never_fit_log_normal():
+    model = PercentileModel([[-2.0, 1.0, 10.0], [0.0, 1.0, 10.0]], method="lognormal")
+    assert not model.lognormal.any()
+    assert np.isfinite(model.scale).all()
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        PercentileModel([1.0, 2.0, 3.0], method="weibull")
+
+
+def test_percentile_label():
+    assert [percentile_label(p) for p in (1, 2, 3, 11, 12, 13, 21, 50, 2.5)] == [
+        "1st Percentile", "2nd Percentile", "3rd Percentile", "11th Percentile", "12th Percentile",
+        "13th Percentile", "21st Percentile", "50th Percentile", "2.5th Percentile"]
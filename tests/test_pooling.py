@@ -0,0 +1,89 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from fed_data import STAT_COLUMNS
+from fed_percentiles import PercentileModel
+from fed_pooling import RegionGroup, mixture_quantile, pool_regions
+from fed_tensor import ParameterTensor
+
+REGIONS = ["Punjab", "Gujarat", "Kerala"]
+P5, MEAN, P95 = STAT_COLUMNS
+
+
+def tensor_with(rows, parameter="STATURE"):
+    """Tensor with one parameter whose sheet has the given {region: (5th, mean, 95th)} for both genders"""
+    tensor = ParameterTensor([parameter], REGIONS)
+    df = pd.DataFrame([[region, *stats] for region, stats in rows.items()], columns=['State'] + STAT_COLUMNS)
+    for gender in tensor.genders:
+        tensor.fill(parameter, gender, df)
+    return tensor
+
+
+def pool(tensor, regions, weights=None):
+    weights = RegionGroup("group", tuple(regions), weights).weight_matrix(tensor.genders)
+    result = pool_regions(tensor, PercentileModel(tensor.values), regions, weights)
+    return {stat: result[0, 0, tensor.stat_index[stat]] for stat in STAT_COLUMNS}
+
+
+def test_single_region_returns_its_own_statistics():
+    tensor = tensor_with({"Punjab": (1550.0, 1660.0, 1770.0), "Gujarat": (1500.0, 1610.0, 1720.0)})
+    pooled = pool(tensor, ["Punjab"])
+    assert pooled[P5] == pytest.approx(1550.0, abs=1e-6)
+    assert pooled[MEAN] == pytest.approx(1660.0, abs=1e-3)
+    assert pooled[P95] == pytest.approx(1770.0, abs=1e-6)
+
+
+def test_single_log_normal_region_returns_its_own_percentiles():
+    # Right-skewed, so the auto fit picks the log-normal
+    tensor = tensor_with({"Kerala": (5.0, 12.0, 30.0)}, parameter="SKINFOLD")
+    model = PercentileModel(tensor.values)
+    assert model.lognormal[0, 0, tensor.region_index["Kerala"]]
+    pooled = pool(tensor, ["Kerala"])
+    assert pooled[P5] == pytest.approx(5.0, rel=1e-6)
+    assert pooled[P95] == pytest.approx(30.0, rel=1e-6)
+
+
+def test_identical_regions_pool_to_the_same_values():
+    stats = (1550.0, 1660.0, 1770.0)
+    tensor = tensor_with({region: stats for region in REGIONS})
+    pooled = pool(tensor, REGIONS, {"Punjab": 5, "Gujarat": 1, "Kerala": 2})
+    assert [pooled[stat] for stat in STAT_COLUMNS] == pytest.approx(list(stats), abs=1e-3)
+
+
+def test_pooled_percentiles_lie_between_the_regions():
+    tensor = tensor_with({"Punjab": (1550.0, 1660.0, 1770.0), "Kerala": (1450.0, 1560.0, 1670.0)})
+    pooled = pool(tensor, ["Punjab", "Kerala"])
+    assert 1450.0 < pooled[P5] < 1550.0
+    assert 1670.0 < pooled[P95] < 1770.0
+    assert pooled[MEAN] == pytest.approx(1610.0, abs=1e-3)
+
+
+def test_weights_pull_towards_the_heavier_region():
+    tensor = tensor_with({"Punjab": (1550.0, 1660.0, 1770.0), "Kerala": (1450.0, 1560.0, 1670.0)})
+    equal = pool(tensor, ["Punjab", "Kerala"])
+    heavy = pool(tensor, ["Punjab", "Kerala"], {"Punjab": 9, "Kerala": 1})
+    assert heavy[P5] > equal[P5] and heavy[P95] > equal[P95]
+    assert heavy[MEAN] == pytest.approx(1650.0, abs=1e-3)
+
+
+def test_regions_without_data_drop_out():
+    tensor = tensor_with({"Punjab": (1550.0, 1660.0, 1770.0)})
+    pooled = pool(tensor, ["Punjab", "Gujarat"])
+    assert pooled[P5] == pytest.approx(1550.0, abs=1e-6)
+    assert np.isnan(list(pool(tensor, ["Gujarat", "Kerala"]).values())).all()
+
+
+def test_mixture_quantile_is_monotonic_in_q():
+    loc = np.array([[1660.0, 1560.0, 3.0]])
+    scale = np.array([[65.0, 40.0, 0.4]])
+    lognormal = np.array([[False, False, True]])
+    weights = np.array([[0.5, 0.3, 0.2]])
+    q = np.linspace(0.01, 0.99, 99)
+    values = np.array([mixture_quantile(loc, scale, lognormal, weights, p)[0] for p in q])
+    assert np.all(np.diff(values) > 0)
+
+
+def test_partial_weight_table_is_rejected():
+    with pytest.raises(ValueError, match="Gujarat"):
+        RegionGroup("group", ("Punjab", "Gujarat"), {"Punjab": 3}).weight_matrix()
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from fed_sketch import TDigest
+
+PERCENTILES = [1, 5, 25, 50, 75, 95, 99]
+
+
+def digest_of(values, chunks=1):
+    digest = TDigest()
+    for chunk in np.array_split(values, chunks):
+        digest.update(chunk)
+    return digest
+
+
+@pytest.fixture(scope="module")
+def stature():
+    return np.random.default_rng(0).normal(1650, 70, 200_000)
+
+
+def rank_error(values, estimates, percentiles):
+    """Distance in percentile ranks between each estimate and the percentile it should sit at"""
+    ranks = np.searchsorted(np.sort(values), estimates) / len(values) * 100
+    return np.abs(ranks - np.asarray(percentiles, dtype=np.float64))
+
+
+def test_quantiles_of_normal_sample(stature):
+    digest = digest_of(stature, chunks=20)
+    estimates = digest.percentiles(PERCENTILES)
+    assert np.all(rank_error(stature, estimates, PERCENTILES) < 0.1)
+    np.testing.assert_allclose(estimates, np.percentile(stature, PERCENTILES), atol=1.0)
+
+
+def test_quantiles_of_skewed_sample():
+    values = np.random.default_rng(1).lognormal(3, 0.5, 100_000)
+    estimates = digest_of(values, chunks=7).percentiles(PERCENTILES)
+    assert np.all(rank_error(values, estimates, PERCENTILES) < 0.1)
+
+
+def test_exact_count_mean_and_extremes(stature):
+    digest = digest_of(stature, chunks=3)
+    assert digest.count == len(stature)
+    assert digest.mean == pytest.approx(stature.mean())
+    assert digest.percentiles([0, 100]).tolist() == [stature.min(), stature.max()]
+
+
+def test_centroids_stay_bounded(stature):
+    digest = digest_of(stature, chunks=50).flush()
+    assert len(digest.means) <= 2 * digest.compression
+
+
+def test_merge_matches_single_digest(stature):
+    rng = np.random.default_rng(2)
+    other = rng.normal(1550, 60, 120_000)
+    merged = digest_of(stature, chunks=4).merge(digest_of(other, chunks=5))
+    combined = np.concatenate([stature, other])
+    single = digest_of(combined, chunks=9)
+
+    assert merged.count == single.count == len(combined)
+    assert merged.mean == pytest.approx(single.mean)
+    assert (merged.min, merged.max) == (single.min, single.max)
+    merged_estimates = merged.percentiles(PERCENTILES)
+    assert np.all(rank_error(combined, merged_estimates, PERCENTILES) < 0.1)
+    np.testing.assert_allclose(merged_estimates, single.percentiles(PERCENTILES), atol=1.0)
+
+
+def test_merge_leaves_inputs_unchanged(stature):
+    left = digest_of(stature[:1000])
+    right = digest_of(stature[1000:2000])
+    before = left.percentiles(PERCENTILES).copy()
+    left.merge(right)
+    assert left.count == 1000
+    np.testing.assert_array_equal(left.percentiles(PERCENTILES), before)
+
+
+def test_cdf_inverts_percentiles(stature):
+    digest = digest_of(stature, chunks=10)
+    np.testing.assert_allclose(digest.cdf(digest.percentiles(PERCENTILES)) * 100, PERCENTILES, atol=0.05)
+
+
+def test_empty_digest_and_non_finite_values():
+    digest = TDigest()
+    assert np.isnan(digest.percentiles([50])).all()
+    assert np.isnan(digest.mean)
+    digest.update([np.nan, np.inf, 5.0])
+    assert digest.count == 1
+    assert digest.percentiles([1, 50, 99]).tolist() == [5.0, 5.0, 5.0]